@@ -0,0 +1,672 @@
+#!/usr/bin/env python3
+"""
+GitHub Project Tasks Creator
+A script to bulk-create tasks in a GitHub project from a JSON tool-call file.
+
+The input file contains (possibly nested) objects of the form:
+    {"tool": "create_test_case_task", "arguments": {...}}
+and this script extracts every such call and creates the corresponding issues,
+adds them to the project, and links parent/child relationships.
+
+Issues are created in batches: each chunk of ~20 tasks is sent as a single
+aliased GraphQL mutation (one round-trip per chunk instead of several per
+task), which also keeps rate-limit consumption low.
+
+Dependencies:
+- requests>=2.28.0
+
+Usage:
+    python create_project_tasks.py tasks.json --org <organization> --project-id <project_id>
+    python create_project_tasks.py tasks.json --org 4d --project-id 745 --dry-run
+    python create_project_tasks.py tasks.json --org 4d --project-id 745 --output results.json
+"""
+
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import queue
+import sqlite3
+import sys
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent / 'mcp'))
+from mcp_server import GitHubProjectMCPServer
+
+# Make ijson optional - used to stream-parse large input files without
+# materializing the whole document in memory
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+    ijson = None
+
+# Make orjson optional - faster whole-file parsing when streaming isn't used
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+# Number of tasks created per GraphQL mutation document (GraphQL node-limit safe)
+BATCH_SIZE = 20
+
+# Number of creation batches kept in flight concurrently — bounded so we
+# overlap round-trips without tripping GitHub's secondary rate limit
+MAX_WORKERS = 4
+
+# Parsed-but-not-yet-created tasks buffered between the parser thread and the
+# creation pipeline; bounded so a huge input file cannot outrun the network
+QUEUE_MAX = 64
+
+# Local index of already-created tasks so a re-run after a partial failure
+# skips everything that previously succeeded
+IDEMPOTENCY_DB = '.created_tasks.sqlite'
+
+
+@dataclass(slots=True)
+class TaskResult:
+    """Per-task outcome record.
+
+    Slotted dataclass instead of a dict: ~3-4x smaller per record, which
+    matters when a run produces tens of thousands of results.
+    """
+    status: str
+    title: str
+    parent: Any = None
+    issue_number: Optional[int] = None
+    issue_url: Optional[str] = None
+    issue_id: Optional[str] = None
+    project_item_id: Optional[str] = None
+    error: Optional[str] = None
+
+
+def task_key(arguments: Dict) -> str:
+    """Stable hash identifying a task by its creation arguments."""
+    return hashlib.blake2b(
+        json.dumps(arguments, sort_keys=True, default=str).encode(),
+        digest_size=16
+    ).hexdigest()
+
+
+def open_idempotency_index(path: str = IDEMPOTENCY_DB) -> sqlite3.Connection:
+    """Open (creating if needed) the local created-tasks index."""
+    conn = sqlite3.connect(path)
+    conn.execute(
+        'CREATE TABLE IF NOT EXISTS created_tasks '
+        '(key TEXT PRIMARY KEY, issue_number INTEGER, url TEXT)'
+    )
+    return conn
+
+
+# Work-list marker carrying a matched call's arguments; emitted once the
+# call's other values have been searched (tuples cannot occur in parsed JSON)
+_EMIT = object()
+
+
+def find_tool_calls(data: Any, tool_name: str = 'create_test_case_task') -> List[Dict]:
+    """Find all tool call argument dicts for tool_name in a JSON tree.
+
+    Iterative traversal with an explicit work-list: no Python frame per node
+    and no RecursionError on deeply nested documents. Children are pushed in
+    reverse so tool calls are found in document order.
+
+    A matched call's arguments payload is pruned — it is data and cannot
+    contain further tool calls — but the call's other values, and the
+    arguments of non-matching objects, are still searched. Each call's
+    arguments are emitted after its searched values, which is the order the
+    streaming parser produces (calls close after their contents).
+    """
+    tool_calls = []
+    stack = deque([data])
+    # Hoist bound methods and types out of the loop; this runs once per JSON
+    # node so attribute lookups add up on large documents
+    pop = stack.pop
+    extend = stack.extend
+    append = tool_calls.append
+
+    while stack:
+        node = pop()
+        node_type = type(node)
+        if node_type is dict:
+            if node.get('tool') == tool_name and 'arguments' in node:
+                stack.append((_EMIT, node['arguments']))
+                # Prune only the arguments payload; the other values sit
+                # above the marker so anything found in them comes first
+                extend(reversed([v for k, v in node.items() if k != 'arguments']))
+                continue
+            extend(reversed(node.values()))
+        elif node_type is list:
+            extend(reversed(node))
+        elif node_type is tuple and node[0] is _EMIT:
+            append(node[1])
+
+    return tool_calls
+
+
+# Sentinel distinguishing "arguments not seen" from "arguments was null"
+_MISSING = object()
+
+# Malformed-input errors the parsers can raise (ijson has its own hierarchy)
+_PARSE_ERRORS = (json.JSONDecodeError, ValueError)
+if IJSON_AVAILABLE:
+    _PARSE_ERRORS = _PARSE_ERRORS + (ijson.JSONError,)
+
+
+def iter_tool_calls_streaming(f: BinaryIO,
+                              tool_name: str = 'create_test_case_task') -> Iterator[Any]:
+    """Stream-parse a JSON file, yielding tool call arguments with ijson.
+
+    Equivalent to json.load + find_tool_calls but never materializes the whole
+    document: only the 'tool' values and 'arguments' subtrees are kept, so peak
+    memory is proportional to a single arguments payload, not the file size.
+    Yielding as each call object closes lets downstream work start while the
+    tail of the file is still parsing.
+
+    Pruning matches find_tool_calls exactly: a matched call's arguments are
+    pure data, so calls nested inside them are never yielded — but the
+    call's other values, and the arguments of non-matching objects, are
+    still searched. When arguments precede the tool key the match is not
+    yet decidable, so calls found under such a frame are parked on it and
+    emitted (or discarded) once its tool value settles the question.
+    """
+    frames = []    # one per open JSON object: last key seen, tool value, arguments value
+    builders = []  # stack of (container, pending_key) capturing an arguments subtree
+    # One entry per open container: (prunes, defer_owner, in_args).
+    # prunes marks the arguments subtree of a frame already known to match.
+    # defer_owner is the nearest open frame whose arguments arrived before
+    # its tool: calls found under it are parked on it, tagged with in_args
+    # (inside its arguments, so data if it matches) vs merely after them
+    # (real calls queued to preserve document order).
+    marks = []
+    prune_depth = 0
+
+    def attach(value: Any) -> None:
+        container, key = builders[-1]
+        if isinstance(container, dict):
+            container[key] = value
+        else:
+            container.append(value)
+
+    def complete_container() -> None:
+        completed = builders.pop()[0]
+        if builders:
+            attach(completed)
+        if frames and frames[-1]['key'] == 'arguments':
+            frames[-1]['args'] = completed
+
+    for event, value in ijson.basic_parse(f):
+        if event == 'map_key':
+            frames[-1]['key'] = value
+            if builders:
+                builders[-1] = (builders[-1][0], value)
+            continue
+
+        starts_arguments = not builders and frames and frames[-1]['key'] == 'arguments'
+
+        if event == 'start_map' or event == 'start_array':
+            owner = frames[-1] if frames else None
+            under_args = owner is not None and owner['key'] == 'arguments'
+            prunes = under_args and owner['tool'] == tool_name
+            if prunes:
+                prune_depth += 1
+            if under_args and owner['tool'] is _MISSING:
+                owner['ambiguous'] = True
+                mark = (prunes, owner, True)
+            elif owner is not None and owner['ambiguous']:
+                mark = (prunes, owner, False)
+            elif marks:
+                # Inherit the enclosing container's deferral context
+                mark = (prunes, marks[-1][1], marks[-1][2])
+            else:
+                mark = (prunes, None, False)
+            marks.append(mark)
+            if builders or starts_arguments:
+                builders.append(({} if event == 'start_map' else [], None))
+            if event == 'start_map':
+                frames.append({'key': None, 'tool': _MISSING, 'args': _MISSING,
+                               'ambiguous': False, 'pending': None})
+        elif event == 'end_map':
+            # The popped mark describes the context this object sits in —
+            # whether it is itself inside a matched call's arguments, and
+            # where its yields must be routed or parked
+            prunes, target, in_args = marks.pop()
+            if prunes:
+                prune_depth -= 1
+            frame = frames.pop()
+            if not prunes and prune_depth == 0:
+                if frame['tool'] == tool_name and frame['args'] is not _MISSING:
+                    emit = (frame['args'],)
+                elif frame['pending'] is not None:
+                    # No tool key ever arrived: the frame is not a call and
+                    # everything parked under it is real
+                    emit = tuple(args for _, args in frame['pending'])
+                else:
+                    emit = ()
+                if emit:
+                    if target is None:
+                        for args in emit:
+                            yield args
+                    elif target['pending'] is None:
+                        target['pending'] = [(in_args, args) for args in emit]
+                    else:
+                        target['pending'].extend((in_args, args) for args in emit)
+            if builders:
+                complete_container()
+        elif event == 'end_array':
+            if marks.pop()[0]:
+                prune_depth -= 1
+            if builders:
+                complete_container()
+        else:
+            # Scalar value
+            if builders:
+                attach(value)
+            if frames:
+                frame = frames[-1]
+                key = frame['key']
+                if key == 'tool':
+                    frame['tool'] = value
+                    if frame['ambiguous']:
+                        # The parked calls' fate is now known: those inside
+                        # a matched call's arguments were data; the rest
+                        # flow on (or park further out) in document order
+                        frame['ambiguous'] = False
+                        pending, frame['pending'] = frame['pending'], None
+                        if pending and prune_depth == 0:
+                            matched = value == tool_name
+                            _, target, in_args = marks[-1] if marks else (False, None, False)
+                            for was_in_args, args in pending:
+                                if matched and was_in_args:
+                                    continue
+                                if target is None:
+                                    yield args
+                                elif target['pending'] is None:
+                                    target['pending'] = [(in_args, args)]
+                                else:
+                                    target['pending'].append((in_args, args))
+                elif key == 'arguments':
+                    # Scalars inside an array under 'arguments' land here
+                    # too, but complete_container overwrites args with the
+                    # finished array before the frame can close
+                    frame['args'] = value
+
+
+# Terminates the parse queue; distinct from any parsed value
+_PARSE_DONE = object()
+
+
+def _dump_jsonl(record: Dict) -> bytes:
+    """Serialize one record as a JSON Lines entry."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(record, default=str) + b'\n'
+    return json.dumps(record, default=str).encode() + b'\n'
+
+
+def _parse_tool_calls(f: BinaryIO, out_queue: queue.Queue) -> None:
+    """Producer thread body: parse an open binary file and enqueue each tool call.
+
+    Parse errors are forwarded through the queue as Exception instances, and
+    the queue is always terminated with _PARSE_DONE so the consumer never
+    blocks on a failed producer.
+    """
+    try:
+        if IJSON_AVAILABLE:
+            # Stream-parse: arguments dicts are enqueued as soon as each tool
+            # call object completes, without building the full document tree
+            for arguments in iter_tool_calls_streaming(f):
+                out_queue.put(arguments)
+        else:
+            if ORJSON_AVAILABLE:
+                try:
+                    # Memory-map the file instead of copying it into a bytes
+                    # buffer; orjson parses straight from the mapping and the
+                    # OS pages data in lazily
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except (OSError, ValueError):
+                    # Pipes (stdin) cannot be mapped — fall back to a read
+                    data = orjson.loads(f.read())
+                else:
+                    try:
+                        data = orjson.loads(memoryview(mm))
+                    finally:
+                        mm.close()
+            else:
+                # stdlib json only accepts str/bytes, so a full read is
+                # unavoidable on this path
+                data = json.loads(f.read())
+            for arguments in find_tool_calls(data):
+                out_queue.put(arguments)
+    except _PARSE_ERRORS as e:
+        out_queue.put(Exception(f"Invalid JSON in {getattr(f, 'name', '<stdin>')}: {e}"))
+    finally:
+        if f is not sys.stdin.buffer:
+            f.close()
+        out_queue.put(_PARSE_DONE)
+
+
+def create_tasks_from_file(server: GitHubProjectMCPServer, json_file: BinaryIO,
+                           org: str = None, project_id: int = None,
+                           dry_run: bool = False, quiet: bool = False,
+                           results_stream: Optional[BinaryIO] = None) -> Dict:
+    """Create all tasks described in an open JSON file object, in batches.
+
+    Parsing and creation are pipelined: a producer thread parses the file and
+    feeds a bounded queue, and full chunks are dispatched to the creation pool
+    as soon as they fill — the first issues are being created while the tail
+    of the JSON is still parsing.
+
+    Returns a results dictionary with one entry per task, in input order.
+    When results_stream (a binary file) is given, each record is written to it
+    as a JSON line the moment it is final and is NOT kept in memory — peak
+    results memory stays O(1) and a crashed run leaves a replayable log.
+    """
+    work_queue = queue.Queue(maxsize=QUEUE_MAX)
+    producer = threading.Thread(
+        target=_parse_tool_calls, args=(json_file, work_queue), daemon=True
+    )
+    producer.start()
+
+    results = {
+        'total': 0,
+        'created': 0,
+        'failed': 0,
+        'skipped': 0,
+        'results': []
+    }
+
+    if dry_run:
+        # Build the whole report and write it once instead of one print()
+        # (and one flush) per task
+        lines = []
+        i = 0
+        while True:
+            item = work_queue.get()
+            if item is _PARSE_DONE:
+                break
+            if isinstance(item, Exception):
+                raise item
+            i += 1
+            # Bind .get once and short-circuit the parent fallback so the
+            # common case (parent_task_number present) costs one lookup
+            g = item.get
+            title = g('title', 'Untitled')
+            parent = g('parent_task_number') or g('parent_task_id') or 'N/A'
+            lines.append(f"  [{i}] Would create: {title} (parent: {parent})")
+            results['results'].append(TaskResult(status='dry_run', title=title, parent=parent))
+        results['total'] = i
+        if lines and not quiet:
+            sys.stdout.write('\n'.join(lines) + '\n')
+        return results
+
+    # Create issues in chunks of BATCH_SIZE — one aliased createIssue mutation
+    # plus one aliased addProjectV2ItemById mutation per chunk. Chunks are
+    # dispatched concurrently (bounded) so their round-trips overlap; results
+    # keep input order because every task carries its original position.
+    # Skip tasks already created by a previous (possibly partial) run
+    index = open_idempotency_index()
+    already_created = {
+        key: (number, url)
+        for key, number, url in index.execute(
+            'SELECT key, issue_number, url FROM created_tasks'
+        )
+    }
+
+    ordered_results: Dict[int, Any] = {}
+    keys: Dict[int, str] = {}
+
+    def create_chunk(chunk: List[Tuple[int, Dict]]) -> List[Tuple[int, TaskResult]]:
+        chunk_args = [arguments for _, arguments in chunk]
+        # Resolve the chunk's repository and assignee node IDs in one query
+        # so the per-task creation path runs against warm caches
+        server.prefetch_task_metadata(org, chunk_args)
+        chunk_results = server.create_test_case_tasks_batch(
+            org=org,
+            project_id=project_id,
+            tasks=chunk_args,
+            batch_size=BATCH_SIZE
+        )
+        return [(position, TaskResult(**result))
+                for (position, _), result in zip(chunk, chunk_results)]
+
+    parse_error = None
+    futures = []
+    chunk: List[tuple] = []
+    position = 0
+    emit_state = {'next': 0, 'lines': []}
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        while True:
+            item = work_queue.get()
+            if item is _PARSE_DONE:
+                break
+            if isinstance(item, Exception):
+                parse_error = item
+                break
+            arguments = item
+            key = task_key(arguments)
+            if key in already_created:
+                number, url = already_created[key]
+                results['skipped'] += 1
+                ordered_results[position] = TaskResult(
+                    status='skipped',
+                    title=arguments.get('title', 'Untitled'),
+                    issue_number=number,
+                    issue_url=url
+                )
+            else:
+                keys[position] = key
+                chunk.append((position, arguments))
+                if len(chunk) == BATCH_SIZE:
+                    futures.append(executor.submit(create_chunk, chunk))
+                    chunk = []
+            position += 1
+
+        if chunk and parse_error is None:
+            futures.append(executor.submit(create_chunk, chunk))
+
+        for future in futures:
+            for pos, result in future.result():
+                ordered_results[pos] = result
+            # Chunks complete in submission order, so everything up to this
+            # chunk's last position is final — emit it now
+            _emit_ready(results, ordered_results, keys, index,
+                        emit_state, results_stream, quiet)
+
+    _emit_ready(results, ordered_results, keys, index,
+                emit_state, results_stream, quiet)
+    if emit_state['lines']:
+        sys.stdout.write('\n'.join(emit_state['lines']) + '\n')
+    index.commit()
+    index.close()
+
+    if parse_error is not None:
+        raise parse_error
+
+    results['total'] = position
+    return results
+
+
+def _emit_ready(results: Dict, ordered_results: Dict[int, TaskResult],
+                keys: Dict[int, str], index: sqlite3.Connection,
+                emit_state: Dict, results_stream: Optional[BinaryIO],
+                quiet: bool) -> None:
+    """Finalize every result whose predecessors are all final, in input order.
+
+    Updates counters, records successes in the idempotency index, buffers
+    progress lines, and either streams the record as a JSON line or appends
+    it to the in-memory results list.
+    """
+    lines = emit_state['lines']
+    pos = emit_state['next']
+    while pos in ordered_results:
+        result = ordered_results.pop(pos)
+        i = pos + 1
+        if result.status == 'success':
+            results['created'] += 1
+            if pos in keys:
+                index.execute(
+                    'INSERT OR REPLACE INTO created_tasks (key, issue_number, url) VALUES (?, ?, ?)',
+                    (keys[pos], result.issue_number, result.issue_url)
+                )
+            if not quiet:
+                lines.append(f"  [{i}] ✅ Created #{result.issue_number}: {result.title}")
+        elif result.status == 'skipped':
+            if not quiet:
+                lines.append(f"  [{i}] ⏭️  Skipped (already created as #{result.issue_number}): {result.title}")
+        else:
+            results['failed'] += 1
+            if not quiet:
+                lines.append(f"  [{i}] ❌ Failed: {result.title} — {result.error}")
+
+        if results_stream is not None:
+            results_stream.write(_dump_jsonl(asdict(result)))
+        else:
+            results['results'].append(result)
+
+        # Buffer progress lines and flush once per batch rather than per task
+        if len(lines) >= BATCH_SIZE:
+            sys.stdout.write('\n'.join(lines) + '\n')
+            lines.clear()
+        pos += 1
+    emit_state['next'] = pos
+
+
+def print_summary(results: Dict) -> None:
+    """Print a summary of the creation run."""
+    print("=" * 80)
+    print(f"📊 Summary: {results['created']} created, {results['skipped']} skipped, "
+          f"{results['failed']} failed, {results['total']} total")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description='Bulk-create tasks in a GitHub project from a JSON tool-call file',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s tasks.json --org 4d --project-id 745
+  %(prog)s tasks.json --org 4d --project-id 745 --dry-run
+  %(prog)s tasks.json --org 4d --project-id 745 --output results.json
+
+Environment variables:
+  GITHUB_TOKENS   Comma-separated GitHub PATs to rotate across (alternative to --token)
+  GITHUB_TOKEN    GitHub Personal Access Token (alternative to --token)
+  GITHUB_ORG      GitHub organization name (alternative to --org)
+        """
+    )
+
+    parser.add_argument(
+        'json_file',
+        type=argparse.FileType('rb'),
+        help='JSON file containing create_test_case_task tool calls (use - for stdin)'
+    )
+
+    parser.add_argument(
+        '--token',
+        help='GitHub Personal Access Token with repo and project permissions (can also use GITHUB_TOKEN env var)'
+    )
+
+    parser.add_argument(
+        '--org',
+        help='GitHub organization name (e.g., "4d") (can also use GITHUB_ORG env var)'
+    )
+
+    parser.add_argument(
+        '--project-id',
+        type=int,
+        required=True,
+        help='GitHub project number (e.g., 745 from the URL)'
+    )
+
+    parser.add_argument(
+        '--dry-run',
+        action='store_true',
+        help='List the tasks that would be created without creating them'
+    )
+
+    parser.add_argument(
+        '--output',
+        help='Write the per-task results as JSON to this file'
+    )
+
+    parser.add_argument(
+        '--quiet',
+        action='store_true',
+        help='Suppress progress messages'
+    )
+
+    args = parser.parse_args()
+
+    # Same precedence as the MCP server: GITHUB_TOKENS (comma-separated
+    # rotation list) counts as a token too
+    token = args.token or os.getenv('GITHUB_TOKENS') or os.getenv('GITHUB_TOKEN')
+    if not token and not args.dry_run:
+        print("Error: GitHub token is required. Provide it via --token argument or GITHUB_TOKEN environment variable.")
+        print("The token needs 'repo' and 'project' permissions.")
+        sys.exit(1)
+
+    org = args.org or os.getenv('GITHUB_ORG')
+    if not org:
+        print("Error: GitHub organization is required. Provide it via --org argument or GITHUB_ORG environment variable.")
+        sys.exit(1)
+
+    try:
+        server = GitHubProjectMCPServer()
+        if not args.dry_run:
+            server.initialize(token)
+
+        # A .jsonl output is written incrementally, one record per line, as
+        # tasks finish; anything else is a single JSON document at the end
+        results_stream = None
+        if args.output and args.output.endswith('.jsonl') and not args.dry_run:
+            results_stream = open(args.output, 'wb')
+
+        try:
+            results = create_tasks_from_file(
+                server, args.json_file,
+                org=org, project_id=args.project_id,
+                dry_run=args.dry_run, quiet=args.quiet,
+                results_stream=results_stream
+            )
+        finally:
+            if results_stream is not None:
+                results_stream.close()
+
+        if not args.quiet:
+            print_summary(results)
+
+        if results_stream is not None:
+            if not args.quiet:
+                print(f"💾 Results written to {args.output}")
+        elif args.output:
+            # Convert the slotted records to dicts only at serialization time
+            results['results'] = [asdict(r) for r in results['results']]
+            if ORJSON_AVAILABLE:
+                # orjson's native indenter is ~10x faster and writes bytes
+                # directly without an intermediate Python string
+                with open(args.output, 'wb') as f:
+                    f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+            else:
+                with open(args.output, 'w') as f:
+                    json.dump(results, f, indent=2)
+            if not args.quiet:
+                print(f"💾 Results written to {args.output}")
+
+        sys.exit(1 if results['failed'] else 0)
+
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
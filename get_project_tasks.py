@@ -10,7 +10,7 @@ This script uses GitHub's GraphQL API to fetch project data and can:
 
 Dependencies:
 - requests>=2.28.0
-- tabulate>=0.9.0 (optional, only required for table output format)
+- tabulate>=0.9.0 (optional, only required for table-pretty output format)
 
 Usage:
     python get_project_tasks.py --token <github_token> --org <organization> --project-id <project_id>
@@ -19,13 +19,20 @@ Usage:
 """
 
 import argparse
+import hashlib
+import itertools
 import json
 import os
+import sqlite3
 import sys
-from typing import Dict, List, Optional, Any
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Tuple
 import requests
 
-# Make tabulate optional - only required for table output format
+# Make tabulate optional - only required for the table-pretty output format
 try:
     from tabulate import tabulate
     TABULATE_AVAILABLE = True
@@ -33,38 +40,146 @@ except ImportError:
     TABULATE_AVAILABLE = False
     tabulate = None
 
+# Make orjson optional - faster JSON encode/decode on the GraphQL hot path
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
 
-class GitHubProjectManager:
-    def __init__(self, token: str):
-        """Initialize with GitHub Personal Access Token."""
-        self.token = token
-        self.session = requests.Session()
-        self.session.headers.update({
-            'Authorization': f'Bearer {token}',
-            'Accept': 'application/vnd.github.v4+json',  # GraphQL API
-            'Content-Type': 'application/json'
-        })
-        self.graphql_url = 'https://api.github.com/graphql'
-    
-    def execute_graphql_query(self, query: str, variables: Dict = None) -> Dict:
-        """Execute a GraphQL query against GitHub's API."""
-        payload = {
-            'query': query,
-            'variables': variables or {}
+# Make ijson optional - incremental parsing of streamed GraphQL responses
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+    ijson = None
+
+
+# On-disk cache for conditional (If-None-Match) requests; 304 responses are
+# free against the primary rate limit and skip the response body entirely.
+# Two tiers: a per-process dict in front of a sqlite store with
+# zlib-compressed bodies (3-5x smaller on disk than the raw JSON).
+CACHE_DIR = os.path.expanduser('~/.cache/get_project_tasks')
+ETAG_CACHE_TTL = 24 * 60 * 60  # Invalidate cached entries older than 24 hours
+
+
+# Concrete GraphQL type -> the item type names used across this script
+_TYPE_BY_TYPENAME = {
+    'Issue': 'issue',
+    'PullRequest': 'pull_request',
+    'DraftIssue': 'draft_issue'
+}
+
+
+# Field-value GraphQL type -> key carrying its scalar value
+_FIELD_VALUE_KEYS = {
+    'ProjectV2ItemFieldTextValue': 'text',
+    'ProjectV2ItemFieldNumberValue': 'number',
+    'ProjectV2ItemFieldSingleSelectValue': 'name',
+    'ProjectV2ItemFieldDateValue': 'date',
+    'ProjectV2ItemFieldIterationValue': 'title'
+}
+
+
+def _infer_content_type(content: Dict) -> Optional[str]:
+    """Classify a content node by its GraphQL __typename.
+
+    Falls back to the old key-probing heuristics for payloads fetched (or
+    ETag-cached) before __typename was part of the selection set.
+    """
+    typename = content.get('__typename')
+    if typename:
+        return _TYPE_BY_TYPENAME.get(typename)
+    if 'number' in content and 'repository' in content:
+        return 'pull_request' if content.get('merged') is not None else 'issue'
+    if 'title' in content and 'creator' in content:
+        return 'draft_issue'
+    return None
+
+
+# Logins, label names/colors, states and statuses recur across thousands of
+# items but each arrives as a fresh str off the wire; interning collapses the
+# duplicates to one object apiece (and makes later equality checks a pointer
+# comparison)
+_intern = sys.intern
+
+
+def _parse_issue_or_pr(content: Dict, parsed: Dict):
+    """Fill parsed with the fields Issues and PullRequests share."""
+    parsed['title'] = content.get('title', '')
+    parsed['body'] = content.get('body', '') or ''
+    parsed['url'] = content.get('url', '')
+    parsed['number'] = content.get('number')
+    parsed['author'] = _intern((content.get('author') or {}).get('login', ''))
+    # `or ()` instead of a {}/[] default: the empty tuple is a singleton, so
+    # the common miss path allocates nothing
+    parsed['assignees'] = tuple(_intern(a['login']) for a in (content.get('assignees') or {}).get('nodes') or ())
+    # SoA layout: labels as a tuple of names with colors in a parallel tuple,
+    # rather than one transient dict per label
+    label_nodes = (content.get('labels') or {}).get('nodes') or ()
+    parsed['labels'] = tuple(_intern(l['name']) for l in label_nodes)
+    parsed['label_colors'] = tuple(_intern(l['color']) for l in label_nodes)
+
+    repo = content.get('repository', {})
+    owner = repo.get('owner', {}).get('login', '')
+    repo_name = repo.get('name', '')
+    parsed['repository'] = _intern(f"{owner}/{repo_name}") if owner and repo_name else ''
+
+
+def _parse_issue(content: Dict, parsed: Dict):
+    parsed['type'] = 'issue'
+    parsed['state'] = _intern(content.get('state', ''))
+    _parse_issue_or_pr(content, parsed)
+
+    # Capture parent-child relationships
+    if content.get('parent'):
+        parsed['parent'] = {
+            'id': content['parent']['id'],
+            'title': content['parent'].get('title', ''),
+            'number': content['parent'].get('number')
         }
-        
-        response = self.session.post(self.graphql_url, json=payload)
-        response.raise_for_status()
-        
-        data = response.json()
-        if 'errors' in data:
-            raise Exception(f"GraphQL errors: {data['errors']}")
-        
-        return data.get('data', {})
-    
-    def get_project_by_number(self, org: str, project_number: int) -> Dict:
-        """Get project information by organization and project number."""
-        query = """
+
+    if content.get('subIssues', {}).get('nodes'):
+        parsed['sub_issues'] = tuple(
+            {
+                'id': sub['id'],
+                'title': sub.get('title', ''),
+                'number': sub.get('number')
+            }
+            for sub in content['subIssues']['nodes']
+        )
+
+    if content.get('subIssuesSummary'):
+        parsed['sub_issues_summary'] = content['subIssuesSummary']
+
+
+def _parse_pull_request(content: Dict, parsed: Dict):
+    parsed['type'] = 'pull_request'
+    parsed['state'] = 'merged' if content.get('merged') else _intern(content.get('state', ''))
+    _parse_issue_or_pr(content, parsed)
+
+
+def _parse_draft_issue(content: Dict, parsed: Dict):
+    parsed['type'] = 'draft_issue'
+    parsed['title'] = content.get('title', '')
+    parsed['body'] = content.get('body', '') or ''
+    parsed['author'] = _intern((content.get('creator') or {}).get('login', ''))
+    parsed['assignees'] = tuple(_intern(a['login']) for a in (content.get('assignees') or {}).get('nodes') or ())
+
+
+# Single string-keyed dispatch instead of re-probing content keys per item
+_CONTENT_PARSERS = {
+    'issue': _parse_issue,
+    'pull_request': _parse_pull_request,
+    'draft_issue': _parse_draft_issue
+}
+
+
+# GraphQL documents used by the manager, built once at import time instead
+# of re-allocating multi-kilobyte strings on every call
+_QUERY_GET_PROJECT = """
         query GetProject($org: String!, $projectNumber: Int!) {
             organization(login: $org) {
                 projectV2(number: $projectNumber) {
@@ -111,141 +226,121 @@ class GitHubProjectManager:
             }
         }
         """
-        
-        variables = {
-            'org': org,
-            'projectNumber': project_number
+
+_QUERY_GET_REPOSITORY_ID = """
+        query GetRepositoryId($owner: String!, $repo: String!) {
+            repository(owner: $owner, name: $repo) {
+                id
+            }
         }
-        
-        result = self.execute_graphql_query(query, variables)
-        project = result.get('organization', {}).get('projectV2')
-        
-        if not project:
-            raise Exception(f"Project {project_number} not found in organization {org}")
-        
-        return project
-    
-    def get_project_items(self, project_id: str, first: int = 100, after: str = None) -> Dict:
-        """Get items from a project with pagination."""
-        query = """
-        query GetProjectItems($projectId: ID!, $first: Int!, $after: String) {
-            node(id: $projectId) {
-                ... on ProjectV2 {
-                    items(first: $first, after: $after) {
-                        pageInfo {
-                            hasNextPage
-                            endCursor
-                        }
+        """
+
+_QUERY_GET_USER_ID = """
+        query GetUserId($username: String!) {
+            user(login: $username) {
+                id
+            }
+        }
+        """
+
+_QUERY_GET_LABELS = """
+            query GetLabels($owner: String!, $repo: String!) {
+                repository(owner: $owner, name: $repo) {
+                    labels(first: 100) {
                         nodes {
                             id
-                            type
-                            createdAt
-                            updatedAt
-                            isArchived
-                            content {
-                                ... on Issue {
-                                    id
-                                    number
-                                    title
-                                    body
-                                    state
-                                    closed
-                                    createdAt
-                                    updatedAt
-                                    url
-                                    author {
-                                        login
-                                    }
-                                    assignees(first: 10) {
-                                        nodes {
-                                            login
-                                        }
-                                    }
-                                    labels(first: 10) {
-                                        nodes {
-                                            name
-                                            color
-                                        }
-                                    }
-                                    repository {
-                                        name
-                                        owner {
-                                            login
-                                        }
-                                    }
-                                    parent {
-                                        id
-                                        title
-                                        number
-                                    }
-                                    subIssues(first: 50) {
-                                        nodes {
-                                            id
-                                            title
-                                            number
-                                        }
-                                    }
-                                    subIssuesSummary {
-                                        total
-                                        completed
-                                        percentCompleted
-                                    }
-                                }
-                                ... on PullRequest {
-                                    id
-                                    number
-                                    title
-                                    body
-                                    state
-                                    closed
-                                    merged
-                                    createdAt
-                                    updatedAt
-                                    url
-                                    author {
-                                        login
-                                    }
-                                    assignees(first: 10) {
-                                        nodes {
-                                            login
-                                        }
-                                    }
-                                    labels(first: 10) {
-                                        nodes {
-                                            name
-                                            color
-                                        }
-                                    }
-                                    repository {
-                                        name
-                                        owner {
-                                            login
-                                        }
-                                    }
-                                }
-                                ... on DraftIssue {
+                            name
+                        }
+                    }
+                }
+            }
+            """
+
+_QUERY_GET_PROJECT_FIELDS = """
+            query GetProjectFields($projectId: ID!) {
+                node(id: $projectId) {
+                    ... on ProjectV2 {
+                        fields(first: 20) {
+                            nodes {
+                                ... on ProjectV2FieldCommon {
                                     id
-                                    title
-                                    body
-                                    createdAt
-                                    updatedAt
-                                    creator {
-                                        login
-                                    }
-                                    assignees(first: 10) {
-                                        nodes {
-                                            login
-                                        }
-                                    }
+                                    name
                                 }
                             }
+                        }
+                    }
+                }
+            }
+            """
+
+_MUTATION_CREATE_ISSUE = """
+        mutation CreateIssue($input: CreateIssueInput!) {
+            createIssue(input: $input) {
+                issue {
+                    id
+                    number
+                    url
+                }
+            }
+        }
+        """
+
+_MUTATION_ADD_TO_PROJECT = """
+        mutation AddToProject($input: AddProjectV2ItemByIdInput!) {
+            addProjectV2ItemById(input: $input) {
+                item {
+                    id
+                }
+            }
+        }
+        """
+
+_MUTATION_ADD_AND_LINK = """
+        mutation AddAndLink($add: AddProjectV2ItemByIdInput!, $link: AddSubIssueInput!) {
+            addToProject: addProjectV2ItemById(input: $add) {
+                item {
+                    id
+                }
+            }
+            linkSub: addSubIssue(input: $link) {
+                subIssue {
+                    id
+                }
+            }
+        }
+        """
+
+_MUTATION_LINK_SUB_ISSUE = """
+        mutation LinkSubIssue($input: AddSubIssueInput!) {
+            addSubIssue(input: $input) {
+                subIssue {
+                    id
+                }
+            }
+        }
+        """
+
+_MUTATION_UPDATE_FIELD = """
+        mutation UpdateProjectField($input: UpdateProjectV2ItemFieldValueInput!) {
+            updateProjectV2ItemFieldValue(input: $input) {
+                projectV2Item {
+                    id
+                }
+            }
+        }
+        """
+
+
+# The fieldValues selection every item query shares, regardless of flags
+_FIELD_VALUES_SELECTION = """
                             fieldValues(first: 20) {
                                 nodes {
+                                    __typename
                                     ... on ProjectV2ItemFieldTextValue {
                                         text
                                         field {
                                             ... on ProjectV2FieldCommon {
-                                                name
+                                                id
                                             }
                                         }
                                     }
@@ -253,7 +348,7 @@ class GitHubProjectManager:
                                         number
                                         field {
                                             ... on ProjectV2FieldCommon {
-                                                name
+                                                id
                                             }
                                         }
                                     }
@@ -261,7 +356,7 @@ class GitHubProjectManager:
                                         name
                                         field {
                                             ... on ProjectV2FieldCommon {
-                                                name
+                                                id
                                             }
                                         }
                                     }
@@ -269,7 +364,7 @@ class GitHubProjectManager:
                                         date
                                         field {
                                             ... on ProjectV2FieldCommon {
-                                                name
+                                                id
                                             }
                                         }
                                     }
@@ -279,202 +374,1157 @@ class GitHubProjectManager:
                                         duration
                                         field {
                                             ... on ProjectV2FieldCommon {
-                                                name
+                                                id
                                             }
                                         }
                                     }
                                 }
-                            }
-                        }
-                    }
-                }
+                            }"""
+
+
+# Canned item queries (page and single-item), one per flag combination,
+# built on first use so the selection string is never recomposed per call
+_ITEMS_QUERY_CACHE: Dict[tuple, str] = {}
+_SINGLE_ITEM_QUERY_CACHE: Dict[tuple, str] = {}
+
+
+def _item_fields(include_body: bool, include_sub_issues: bool, include_parent: bool,
+                 type_hint: Optional[str] = None) -> str:
+    """Compose the per-item field selection for a flag combination.
+
+    type_hint ('issue', 'pull_request' or 'draft_issue') drops the content
+    fragments of the other types entirely, so single-type runs never fetch
+    (or parse) the label/assignee payloads of items they would discard.
+    """
+    body = '\n                                    body' if include_body else ''
+    parent = ''
+    if include_parent:
+        parent = """
+                                    parent {
+                                        id
+                                        title
+                                        number
+                                    }"""
+    sub_issues = ''
+    if include_sub_issues:
+        sub_issues = """
+                                    subIssues(first: 50) {
+                                        nodes {
+                                            id
+                                            title
+                                            number
+                                        }
+                                    }"""
+
+    issue_fragment = ''
+    if type_hint in (None, 'issue'):
+        issue_fragment = f"""
+                                ... on Issue {{
+                                    id
+                                    number
+                                    title{body}
+                                    state
+                                    closed
+                                    createdAt
+                                    updatedAt
+                                    url
+                                    author {{
+                                        login
+                                    }}
+                                    assignees(first: 10) {{
+                                        nodes {{
+                                            login
+                                        }}
+                                    }}
+                                    labels(first: 10) {{
+                                        nodes {{
+                                            name
+                                            color
+                                        }}
+                                    }}
+                                    repository {{
+                                        name
+                                        owner {{
+                                            login
+                                        }}
+                                    }}{parent}{sub_issues}
+                                    subIssuesSummary {{
+                                        total
+                                        completed
+                                        percentCompleted
+                                    }}
+                                }}"""
+
+    pr_fragment = ''
+    if type_hint in (None, 'pull_request'):
+        pr_fragment = f"""
+                                ... on PullRequest {{
+                                    id
+                                    number
+                                    title{body}
+                                    state
+                                    closed
+                                    merged
+                                    createdAt
+                                    updatedAt
+                                    url
+                                    author {{
+                                        login
+                                    }}
+                                    assignees(first: 10) {{
+                                        nodes {{
+                                            login
+                                        }}
+                                    }}
+                                    labels(first: 10) {{
+                                        nodes {{
+                                            name
+                                            color
+                                        }}
+                                    }}
+                                    repository {{
+                                        name
+                                        owner {{
+                                            login
+                                        }}
+                                    }}
+                                }}"""
+
+    draft_fragment = ''
+    if type_hint in (None, 'draft_issue'):
+        draft_fragment = f"""
+                                ... on DraftIssue {{
+                                    id
+                                    title{body}
+                                    createdAt
+                                    updatedAt
+                                    creator {{
+                                        login
+                                    }}
+                                    assignees(first: 10) {{
+                                        nodes {{
+                                            login
+                                        }}
+                                    }}
+                                }}"""
+
+    return f"""
+                            id
+                            type
+                            createdAt
+                            updatedAt
+                            isArchived
+                            content {{
+                                __typename{issue_fragment}{pr_fragment}{draft_fragment}
+                            }}{_FIELD_VALUES_SELECTION}"""
+
+
+def _items_query(include_body: bool, include_sub_issues: bool, include_parent: bool,
+                 type_hint: Optional[str] = None) -> str:
+    """Compose (and memoize) the project-items page query for a flag combination."""
+    key = (include_body, include_sub_issues, include_parent, type_hint)
+    cached = _ITEMS_QUERY_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    query = f"""
+        query GetProjectItems($projectId: ID!, $first: Int!, $after: String) {{
+            node(id: $projectId) {{
+                ... on ProjectV2 {{
+                    items(first: $first, after: $after) {{
+                        pageInfo {{
+                            hasNextPage
+                            endCursor
+                        }}
+                        nodes {{{_item_fields(*key)}
+                        }}
+                    }}
+                }}
+            }}
+        }}
+        """
+    _ITEMS_QUERY_CACHE[key] = query
+    return query
+
+
+def _single_item_query(include_body: bool, include_sub_issues: bool, include_parent: bool,
+                       type_hint: Optional[str] = None) -> str:
+    """Compose (and memoize) the single-item query for a flag combination.
+
+    Same selection as a page of _items_query, scoped to one ProjectV2Item
+    node, so a lookup by item id transfers one item instead of paging the
+    whole project.
+    """
+    key = (include_body, include_sub_issues, include_parent, type_hint)
+    cached = _SINGLE_ITEM_QUERY_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    query = f"""
+        query GetProjectItem($itemId: ID!) {{
+            node(id: $itemId) {{
+                ... on ProjectV2Item {{{_item_fields(*key)}
+                }}
+            }}
+        }}
+        """
+    _SINGLE_ITEM_QUERY_CACHE[key] = query
+    return query
+
+
+def _filter_set(value, lower: bool = False) -> Optional[frozenset]:
+    """Normalize a filter value (string, comma-separated or list) to a frozenset."""
+    if not value:
+        return None
+    if isinstance(value, str):
+        value = value.split(',')
+    if lower:
+        return frozenset(v.strip().lower() for v in value if v.strip())
+    return frozenset(v.strip() for v in value if v.strip())
+
+
+# Replaces newlines in one C-level pass when flattening descriptions
+_NL_TRANS = str.maketrans({'\n': ' ', '\r': ' '})
+
+
+# Display icons: per item type, and label keywords that override them
+# (checked in order, most specific first)
+_TYPE_ICONS = {
+    'issue': '�',
+    'pull_request': '🔀',
+    'draft_issue': '📝'
+}
+_LABEL_ICONS = (
+    ('bug', '🐛'),
+    ('test', '🧪'),
+    ('requirement', '📋'),
+    ('feature', '✨'),
+    ('dev', '⚙️'),
+)
+
+
+# Words too common to count as significant terms when matching titles
+_COMMON_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to',
+    'for', 'of', 'with', 'by', 'shall', 'have', 'means'
+})
+
+
+# A session is rotated out once its reported rate-limit budget drops below
+# this, as long as another session still has headroom
+RATE_LIMIT_FLOOR = 50
+
+
+# Backoff between 5xx retries of read queries (mutations are never
+# replayed on 5xx); mirrors the transport Retry's 1.5 backoff factor
+_READ_RETRY_DELAYS = (1.5, 3.0, 6.0)
+
+
+class GitHubProjectManager:
+    def __init__(self, token: str, cache_enabled: bool = True, cache_ttl: int = None):
+        """Initialize with one or more GitHub Personal Access Tokens.
+
+        token may be a single PAT or a comma-separated list; requests are
+        round-robined across one session per token, multiplying the effective
+        5000 req/hr budget by the number of tokens. cache_enabled/cache_ttl
+        control the on-disk conditional-request cache.
+        """
+        tokens = [t.strip() for t in token.split(',') if t.strip()]
+        self.token = tokens[0]
+        self._sessions = []
+        for t in tokens:
+            session = requests.Session()
+            session.headers.update({
+                'Authorization': f'Bearer {t}',
+                'Accept': 'application/vnd.github.v4+json',  # GraphQL API
+                'Content-Type': 'application/json'
+            })
+            # Secondary rate limits (429 + Retry-After) are retried at the
+            # transport level: a 429 means the request was rejected before
+            # executing, so replaying it is always safe. 5xx responses are
+            # NOT in the forcelist — all GraphQL traffic is POST, and a 502
+            # after a committed createIssue would silently replay the
+            # mutation and duplicate it. Read queries get their own 5xx
+            # retry loop in execute_graphql_query instead.
+            retry = requests.adapters.Retry(
+                total=5,
+                status_forcelist=[429],
+                allowed_methods=frozenset({'POST'}),
+                backoff_factor=1.5,
+                respect_retry_after_header=True
+            )
+            # Everything goes to api.github.com, so one pool is enough; size
+            # it above the bulk-creation worker count so concurrent threads
+            # sharing a session keep their TLS connections alive instead of
+            # discarding and re-handshaking (~100-200ms each)
+            adapter = requests.adapters.HTTPAdapter(
+                max_retries=retry, pool_connections=1, pool_maxsize=16
+            )
+            session.mount('https://', adapter)
+            self._sessions.append(session)
+        self.session = self._sessions[0]
+        self._session_cycle = itertools.cycle(self._sessions)
+        # Fail fast on dead connections instead of hanging a whole page walk
+        self._timeout = (5, 30)  # (connect, read) seconds
+        # Last X-RateLimit-Remaining / X-RateLimit-Reset seen per session;
+        # unknown means usable
+        self._rate_remaining = {}
+        self._rate_reset = {}
+        self.graphql_url = 'https://api.github.com/graphql'
+        self._cache_enabled = cache_enabled
+        self._cache_ttl = cache_ttl if cache_ttl is not None else ETAG_CACHE_TTL
+        self._etag_cache: Dict[str, Dict] = {}
+        self._cache_conn = None
+        self._cache_lock = threading.Lock()
+        # Read-aside cache for stable id lookups (repos, users, labels,
+        # fields); one entry per distinct key for the process lifetime
+        self._id_cache: Dict[tuple, Any] = {}
+        # field node id -> field name, filled from project metadata; item
+        # pages select only the field id per value and join the name here
+        self._field_name_by_id: Dict[str, str] = {}
+
+    def clear_cache(self):
+        """Drop cached id lookups (for long-running processes)."""
+        self._id_cache.clear()
+
+    def close(self):
+        """Close the pooled HTTP sessions and the on-disk cache connection."""
+        for session in self._sessions:
+            session.close()
+        with self._cache_lock:
+            if self._cache_conn is not None:
+                self._cache_conn.close()
+                self._cache_conn = None
+
+    def _next_session(self) -> requests.Session:
+        """Pick the next session, skipping any cooling close to its rate limit."""
+        now = time.time()
+        for _ in range(len(self._sessions)):
+            session = next(self._session_cycle)
+            key = id(session)
+            if self._rate_remaining.get(key, RATE_LIMIT_FLOOR) >= RATE_LIMIT_FLOOR:
+                return session
+            # A cooling token becomes usable again once its window resets
+            if now >= self._rate_reset.get(key, 0):
+                self._rate_remaining.pop(key, None)
+                return session
+        # Every token is nearly exhausted — return the next one anyway and
+        # let GitHub's 403/429 handling upstream deal with the backoff
+        return next(self._session_cycle)
+
+    def _cache_db(self) -> sqlite3.Connection:
+        """Open (once) the on-disk ETag store."""
+        if self._cache_conn is None:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            # The lookahead/creation pools call this from worker threads, so
+            # cross-thread use is allowed and serialized by _cache_lock
+            self._cache_conn = sqlite3.connect(
+                os.path.join(CACHE_DIR, 'cache.sqlite'), check_same_thread=False
+            )
+            self._cache_conn.execute(
+                'CREATE TABLE IF NOT EXISTS etags '
+                '(key TEXT PRIMARY KEY, etag TEXT, ts REAL, body BLOB)'
+            )
+            # Whole-project item snapshots for re-querying with different
+            # filters without touching the network
+            self._cache_conn.execute(
+                'CREATE TABLE IF NOT EXISTS snapshots '
+                '(key TEXT PRIMARY KEY, ts REAL, body BLOB)'
+            )
+        return self._cache_conn
+
+    def _cache_get(self, key: str) -> Optional[Dict]:
+        """Two-tier lookup: per-process dict first, then the sqlite store."""
+        entry = self._etag_cache.get(key)
+        if entry:
+            return entry
+
+        try:
+            with self._cache_lock:
+                row = self._cache_db().execute(
+                    'SELECT etag, ts, body FROM etags WHERE key = ?', (key,)
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        if not row:
+            return None
+
+        etag, ts, body = row
+        if ts < time.time() - self._cache_ttl:
+            return None
+        try:
+            data = json.loads(zlib.decompress(body))
+        except (zlib.error, ValueError):
+            return None
+
+        entry = {'etag': etag, 'ts': ts, 'data': data}
+        self._etag_cache[key] = entry
+        return entry
+
+    def _cache_put(self, key: str, etag: str, data: Dict):
+        """Store a response in both cache tiers (on-disk best effort)."""
+        entry = {'etag': etag, 'ts': time.time(), 'data': data}
+        self._etag_cache[key] = entry
+        try:
+            body = zlib.compress(json.dumps(data, default=str).encode())
+            with self._cache_lock:
+                self._cache_db().execute(
+                    'INSERT OR REPLACE INTO etags (key, etag, ts, body) VALUES (?, ?, ?, ?)',
+                    (key, etag, entry['ts'], body)
+                )
+                self._cache_conn.commit()
+        except (sqlite3.Error, OSError, ValueError):
+            pass
+
+    @staticmethod
+    def _snapshot_key(project_id: str, include_body: bool,
+                      include_sub_issues: bool, include_parent: bool,
+                      type_hint: str = None) -> str:
+        # Keyed per selection-flag combination so a tree run never reuses a
+        # table run's slimmer payload (nor a single-type run's)
+        return (f'{project_id}:{int(include_body)}{int(include_sub_issues)}'
+                f'{int(include_parent)}:{type_hint or ""}')
+
+    def load_items_snapshot(self, project_id: str, include_body: bool = False,
+                            include_sub_issues: bool = False,
+                            include_parent: bool = False,
+                            type_hint: str = None,
+                            watermark: str = None) -> Optional[List[Dict]]:
+        """Return the locally persisted raw items for a project, or None.
+
+        Re-running the CLI with different filters is the common case during
+        refresh loops; a snapshot within the cache TTL serves those runs
+        entirely from disk. When the caller passes the project's updatedAt
+        as watermark, a matching snapshot is served regardless of age (the
+        project has not changed) and a stale one is dropped immediately.
+        --refresh (or --no-cache) bypasses this.
+        """
+        if not self._cache_enabled:
+            return None
+        key = self._snapshot_key(project_id, include_body, include_sub_issues,
+                                 include_parent, type_hint)
+        try:
+            with self._cache_lock:
+                row = self._cache_db().execute(
+                    'SELECT ts, body FROM snapshots WHERE key = ?', (key,)
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        if not row:
+            return None
+        try:
+            payload = json.loads(zlib.decompress(row[1]))
+        except (zlib.error, ValueError):
+            return None
+        stored_mark = None
+        if isinstance(payload, dict):
+            stored_mark = payload.get('watermark')
+            payload = payload.get('items')
+        if watermark and stored_mark:
+            return payload if stored_mark == watermark else None
+        # No watermark to compare: fall back to the age rule
+        if row[0] < time.time() - self._cache_ttl:
+            return None
+        return payload
+
+    def save_items_snapshot(self, project_id: str, items: List[Dict],
+                            include_body: bool = False,
+                            include_sub_issues: bool = False,
+                            include_parent: bool = False,
+                            type_hint: str = None,
+                            watermark: str = None):
+        """Persist the raw items of a project to the on-disk cache (best effort)."""
+        if not self._cache_enabled:
+            return
+        key = self._snapshot_key(project_id, include_body, include_sub_issues,
+                                 include_parent, type_hint)
+        try:
+            payload = {'watermark': watermark, 'items': items}
+            body = zlib.compress(json.dumps(payload, default=str).encode())
+            with self._cache_lock:
+                self._cache_db().execute(
+                    'INSERT OR REPLACE INTO snapshots (key, ts, body) VALUES (?, ?, ?)',
+                    (key, time.time(), body)
+                )
+                self._cache_conn.commit()
+        except (sqlite3.Error, OSError, ValueError):
+            pass
+
+    def execute_graphql_query(self, query: str, variables: Dict = None,
+                              stream: bool = False) -> Dict:
+        """Execute a GraphQL query against GitHub's API.
+
+        Read queries send If-None-Match with the last seen ETag; on 304 the
+        cached body is returned without re-fetching. Mutations bypass the cache.
+
+        Transient 5xx responses are retried with backoff for read queries
+        only: a 502 can arrive after a mutation has committed server-side,
+        and replaying e.g. a createIssue document would duplicate the issues.
+        Mutations surface the 5xx to the caller instead.
+
+        With stream=True (and ijson installed) the response body is parsed
+        incrementally off the socket, so parsing overlaps the transfer and
+        the raw bytes of a large page are never buffered in full alongside
+        the parsed dicts.
+        """
+        payload = {
+            'query': query,
+            'variables': variables or {}
+        }
+
+        is_mutation = query.lstrip().startswith('mutation')
+
+        cache_key = None
+        headers = {}
+        if self._cache_enabled and not is_mutation:
+            cache_key = hashlib.blake2b(
+                (query + json.dumps(variables or {}, sort_keys=True)).encode(),
+                digest_size=16
+            ).hexdigest()
+            cached = self._cache_get(cache_key)
+            if cached:
+                headers['If-None-Match'] = cached['etag']
+
+        want_stream = stream and IJSON_AVAILABLE
+
+        if ORJSON_AVAILABLE:
+            # orjson serializes the payload 2-5x faster than the stdlib
+            # encoder requests uses for json=
+            body = orjson.dumps(payload)
+        else:
+            body = json.dumps(payload).encode()
+
+        for delay in _READ_RETRY_DELAYS + (None,):
+            session = self._next_session()
+            response = session.post(self.graphql_url, data=body,
+                                    headers=headers, stream=want_stream,
+                                    timeout=self._timeout)
+            if is_mutation or delay is None or response.status_code < 500:
+                break
+            # Transient upstream failure on an idempotent read — retry it
+            # (on the next token's session) after a short backoff
+            response.close()
+            time.sleep(delay)
+
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        if remaining is not None:
+            try:
+                self._rate_remaining[id(session)] = int(remaining)
+            except ValueError:
+                pass
+        reset = response.headers.get('X-RateLimit-Reset')
+        if reset is not None:
+            try:
+                self._rate_reset[id(session)] = int(reset)
+            except ValueError:
+                pass
+
+        if response.status_code == 304 and cache_key:
+            if want_stream:
+                response.close()
+            return self._etag_cache[cache_key]['data']
+
+        response.raise_for_status()
+
+        if want_stream:
+            # Undo transfer encoding so ijson sees plain JSON bytes
+            response.raw.decode_content = True
+            data = {}
+            try:
+                for key, value in ijson.kvitems(response.raw, ''):
+                    data[key] = value
+            finally:
+                response.close()
+        # Page bodies run to hundreds of KB; orjson parses them several
+        # times faster than response.json()
+        elif ORJSON_AVAILABLE:
+            data = orjson.loads(response.content)
+        else:
+            data = response.json()
+        if 'errors' in data:
+            raise Exception(f"GraphQL errors: {data['errors']}")
+
+        result = data.get('data', {})
+
+        if cache_key:
+            etag = response.headers.get('ETag')
+            if etag:
+                self._cache_put(cache_key, etag, result)
+
+        return result
+    
+    def get_project_by_number(self, org: str, project_number: int) -> Dict:
+        """Get project information by organization and project number."""
+        query = _QUERY_GET_PROJECT
+        
+        variables = {
+            'org': org,
+            'projectNumber': project_number
+        }
+        
+        result = self.execute_graphql_query(query, variables)
+        project = result.get('organization', {}).get('projectV2')
+
+        if not project:
+            raise Exception(f"Project {project_number} not found in organization {org}")
+
+        # Record the field id -> name join used when parsing item pages
+        for field in project.get('fields', {}).get('nodes', []):
+            if field.get('id') and field.get('name'):
+                self._field_name_by_id[field['id']] = field['name']
+
+        return project
+    
+    def get_project_items(self, project_id: str, first: int = 100, after: str = None,
+                          include_body: bool = False, include_sub_issues: bool = False,
+                          include_parent: bool = False, type_hint: str = None) -> Dict:
+        """Get items from a project with pagination.
+
+        The selection set is composed from the flags so callers only pay for
+        what they use: body, the subIssues list and parent are omitted by
+        default (subIssuesSummary, three scalars, is always included).
+        type_hint restricts the content fragments to one item type; other
+        items come back with just their __typename.
+        """
+        query = _items_query(include_body, include_sub_issues, include_parent, type_hint)
+
+        variables = {
+            'projectId': project_id,
+            'first': first
+        }
+        
+        if after:
+            variables['after'] = after
+
+        # Item pages are by far the largest payloads — stream-parse them
+        return self.execute_graphql_query(query, variables, stream=True)
+    
+    def get_all_project_items(self, project_id: str, include_body: bool = False,
+                              include_sub_issues: bool = False,
+                              include_parent: bool = False,
+                              type_hint: str = None) -> List[Dict]:
+        """Get all items from a project, handling pagination.
+
+        ProjectV2 cursors are opaque, so pages cannot be fetched fully in
+        parallel (aliasing several pages into one query would need their
+        cursors up front) — but the next request is fired as soon as a
+        page's endCursor arrives, overlapping it with processing the
+        current page.
+        """
+        all_items = []
+
+        def fetch(after):
+            return self.get_project_items(
+                project_id, 100, after,
+                include_body=include_body,
+                include_sub_issues=include_sub_issues,
+                include_parent=include_parent,
+                type_hint=type_hint
+            )
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(fetch, None)
+            while future is not None:
+                result = future.result()
+                project_data = result.get('node', {})
+                items_data = project_data.get('items', {})
+
+                # Kick off the next page before touching this page's nodes
+                page_info = items_data.get('pageInfo', {})
+                if page_info.get('hasNextPage', False):
+                    future = executor.submit(fetch, page_info.get('endCursor'))
+                else:
+                    future = None
+
+                all_items.extend(items_data.get('nodes', []))
+
+        return all_items
+
+    def get_single_project_item(self, item_id: str, include_body: bool = True,
+                                include_sub_issues: bool = True,
+                                include_parent: bool = True) -> Optional[Dict]:
+        """Fetch one project item by its node id.
+
+        Same per-item selection as get_all_project_items, scoped to a
+        single ProjectV2Item node, so a lookup by id transfers one item
+        instead of paging the whole project. Returns None when the id does
+        not resolve to a project item.
+        """
+        query = _single_item_query(include_body, include_sub_issues, include_parent)
+        result = self.execute_graphql_query(query, {'itemId': item_id})
+        item = result.get('node')
+        # A non-item node id resolves but carries none of the fragment fields
+        if not item or 'id' not in item:
+            return None
+        return item
+
+
+    def filter_items(self, items: List[Dict], filters: Dict,
+                     parse: bool = False) -> List[Dict]:
+        """Filter items based on provided criteria.
+
+        type/assignee/label filters accept a single value, a comma-separated
+        string or a list; each is normalized to a frozenset once before the
+        loop, so per-item work is a C-implemented membership test instead of
+        repeated lowering/comparison. Predicates run cheapest first (type,
+        then assignee, label, status) with any() short-circuits, so rejected
+        items never pay for the fieldValues scan.
+
+        With parse=True the surviving items come back through
+        parse_item_data, fusing filtering and parsing into one traversal —
+        rejected items are never parsed.
+        """
+        wanted_types = _filter_set(filters.get('type'))
+        wanted_assignees = _filter_set(filters.get('assignee'))
+        wanted_labels = _filter_set(filters.get('label'), lower=True)
+        wanted_status = filters['status'].lower() if filters.get('status') else None
+        # Field values carry only the field id; resolve which ids mean Status
+        status_field_ids = frozenset(
+            fid for fid, name in self._field_name_by_id.items() if name.lower() == 'status'
+        ) if wanted_status else frozenset()
+
+        filtered_items = []
+
+        for item in items:
+            content = item.get('content')
+            if content is None:
+                # Skip items with no content (archived or null items)
+                continue
+
+            if wanted_types and _infer_content_type(content) not in wanted_types:
+                continue
+
+            if wanted_assignees and not any(
+                a['login'] in wanted_assignees
+                for a in content.get('assignees', {}).get('nodes', ())
+            ):
+                continue
+
+            # Case-insensitive label matching
+            if wanted_labels and not any(
+                l['name'].lower() in wanted_labels
+                for l in content.get('labels', {}).get('nodes', ())
+            ):
+                continue
+
+            if wanted_status and not any(
+                (field_value.get('field', {}).get('id') in status_field_ids
+                 or field_value.get('field', {}).get('name', '').lower() == 'status')
+                and field_value.get('name', '').lower() == wanted_status
+                for field_value in item.get('fieldValues', {}).get('nodes', ())
+            ):
+                continue
+
+            filtered_items.append(self.parse_item_data(item) if parse else item)
+
+        return filtered_items
+    
+    def parse_item_data(self, item: Dict) -> Dict:
+        """Parse item data into a standardized format."""
+        content = item.get('content')
+        if content is None:
+            content = {}
+        
+        parsed = {
+            'id': item.get('id'),
+            # Content (Issue/PR/Draft) node id — distinct from the ProjectV2
+            # item id above; mutations on the content (e.g. addSubIssue)
+            # need this one
+            'content_id': content.get('id'),
+            'type': 'unknown',
+            'title': '',
+            'body': '',
+            'url': '',
+            'state': '',
+            'author': '',
+            'assignees': (),
+            'labels': (),  # Label names; colors live in the parallel label_colors
+            'label_colors': (),
+            'repository': '',
+            'number': None,  # GitHub issue/PR number
+            'parent': None,  # Parent issue information
+            'sub_issues': (),  # Sub-issue references
+            'sub_issues_summary': None,  # Summary of sub-issues
+            'created_at': content.get('createdAt', '') if content else '',
+            'updated_at': content.get('updatedAt', '') if content else '',
+            'project_fields': {}
+        }
+        
+        # Determine type via __typename and dispatch to the right parser
+        if content:
+            parser = _CONTENT_PARSERS.get(_infer_content_type(content))
+            if parser:
+                parser(content, parsed)
+        
+        # Parse project fields: one dict lookup on __typename instead of a
+        # membership-test ladder, and immune to new value variants that
+        # happen to share a key name
+        project_fields = parsed['project_fields']
+        for field_value in (item.get('fieldValues') or {}).get('nodes') or ():
+            value_key = _FIELD_VALUE_KEYS.get(field_value.get('__typename'))
+            if value_key is None:
+                # Pre-__typename payload (ETag-cached): probe keys as before
+                value_key = next((k for k in ('text', 'number', 'name', 'date', 'title')
+                                  if k in field_value), None)
+            if value_key is not None and value_key in field_value:
+                field = field_value.get('field', {})
+                # Pages select only the field id; resolve the name through
+                # the project-metadata map (old cached payloads carry names)
+                field_name = self._field_name_by_id.get(field.get('id')) or field.get('name', '')
+                value = field_value[value_key]
+                # Status/iteration names repeat across most of the project
+                project_fields[field_name] = _intern(value) if type(value) is str else value
+
+        return parsed
+
+    def get_repository_id(self, owner: str, repo: str) -> str:
+        """Get the node ID of a repository (cached per process)."""
+        cache_key = ('repo', owner, repo)
+        if cache_key in self._id_cache:
+            return self._id_cache[cache_key]
+
+        query = _QUERY_GET_REPOSITORY_ID
+
+        result = self.execute_graphql_query(query, {'owner': owner, 'repo': repo})
+        repository = result.get('repository')
+
+        if not repository:
+            raise Exception(f"Repository {owner}/{repo} not found")
+
+        self._id_cache[cache_key] = repository['id']
+        return repository['id']
+
+    def get_user_id(self, username: str) -> str:
+        """Get the node ID of a user (cached per process)."""
+        cache_key = ('user', username)
+        if cache_key in self._id_cache:
+            return self._id_cache[cache_key]
+
+        query = _QUERY_GET_USER_ID
+
+        result = self.execute_graphql_query(query, {'username': username})
+        user = result.get('user')
+
+        if not user:
+            raise Exception(f"User {username} not found")
+
+        self._id_cache[cache_key] = user['id']
+        return user['id']
+
+    def get_label_ids(self, owner: str, repo: str, label_names: List[str]) -> List[str]:
+        """Get the node IDs of labels in a repository (case-insensitive match).
+
+        The repository's full label map is fetched once and cached, so later
+        calls for any label in the same repo never hit the network.
+        """
+        cache_key = ('labels', owner, repo)
+        label_map = self._id_cache.get(cache_key)
+        if label_map is None:
+            query = _QUERY_GET_LABELS
+
+            result = self.execute_graphql_query(query, {'owner': owner, 'repo': repo})
+            labels = result.get('repository', {}).get('labels', {}).get('nodes', [])
+            label_map = {label['name'].lower(): label['id'] for label in labels}
+            self._id_cache[cache_key] = label_map
+
+        return [label_map[name.lower()] for name in label_names if name.lower() in label_map]
+
+    def get_field_id_by_name(self, project_id: str, field_name: str) -> Optional[str]:
+        """Get the node ID of a project field by its name.
+
+        The project's full field map is fetched once and cached; later calls
+        for any field of the same project resolve in Python.
+        """
+        cache_key = ('fields', project_id)
+        field_map = self._id_cache.get(cache_key)
+        if field_map is None:
+            query = _QUERY_GET_PROJECT_FIELDS
+
+            result = self.execute_graphql_query(query, {'projectId': project_id})
+            fields = result.get('node', {}).get('fields', {}).get('nodes', [])
+            field_map = {field['name']: field['id'] for field in fields if field.get('name')}
+            self._id_cache[cache_key] = field_map
+            self._field_name_by_id.update({fid: name for name, fid in field_map.items()})
+
+        return field_map.get(field_name)
+
+    def resolve_ids(self, owner: str, repo: str, usernames: List[str] = None,
+                    label_names: List[str] = None, field_names: List[str] = None,
+                    project_id: str = None) -> Dict:
+        """Resolve repository, user, label and field node IDs in one request.
+
+        Composes a single aliased GraphQL document instead of one round-trip
+        per lookup. Returns a dict with 'repository_id', plus 'user_ids'
+        (username -> id), 'label_ids' (list matching label_names,
+        case-insensitive, unknown names dropped) and 'field_ids'
+        (field name -> id) for whatever was requested.
+        """
+        label_selection = ''
+        if label_names:
+            label_selection = ' labels(first: 100) { nodes { id name } }'
+
+        variable_defs = ['$owner: String!', '$repo: String!']
+        selections = [f'repo: repository(owner: $owner, name: $repo) {{ id{label_selection} }}']
+        variables = {'owner': owner, 'repo': repo}
+
+        usernames = usernames or []
+        for i, username in enumerate(usernames):
+            variable_defs.append(f'$u{i}: String!')
+            selections.append(f'u{i}: user(login: $u{i}) {{ id }}')
+            variables[f'u{i}'] = username
+
+        if field_names and project_id:
+            variable_defs.append('$projectId: ID!')
+            selections.append(
+                'project: node(id: $projectId) { ... on ProjectV2 '
+                '{ fields(first: 20) { nodes { ... on ProjectV2FieldCommon { id name } } } } }'
+            )
+            variables['projectId'] = project_id
+
+        query = f"query ResolveIds({', '.join(variable_defs)}) {{\n" \
+                + '\n'.join(selections) + "\n}"
+        result = self.execute_graphql_query(query, variables)
+
+        repository = result.get('repo')
+        if not repository:
+            raise Exception(f"Repository {owner}/{repo} not found")
+
+        resolved = {'repository_id': repository['id']}
+        self._id_cache[('repo', owner, repo)] = repository['id']
+
+        if usernames:
+            user_ids = {}
+            for i, username in enumerate(usernames):
+                user = result.get(f'u{i}')
+                if not user:
+                    raise Exception(f"User {username} not found")
+                user_ids[username] = user['id']
+                self._id_cache[('user', username)] = user['id']
+            resolved['user_ids'] = user_ids
+
+        if label_names:
+            label_map = {
+                label['name'].lower(): label['id']
+                for label in repository.get('labels', {}).get('nodes', [])
+            }
+            self._id_cache[('labels', owner, repo)] = label_map
+            resolved['label_ids'] = [
+                label_map[name.lower()] for name in label_names if name.lower() in label_map
+            ]
+
+        if field_names and project_id:
+            fields = result.get('project', {}).get('fields', {}).get('nodes', [])
+            self._field_name_by_id.update(
+                {field['id']: field['name'] for field in fields if field.get('name')}
+            )
+            wanted = set(field_names)
+            resolved['field_ids'] = {
+                field['name']: field['id'] for field in fields if field.get('name') in wanted
             }
+
+        return resolved
+
+    def create_issue(self, repository_id: str, title: str, body: str = '',
+                     label_ids: List[str] = None, assignee_ids: List[str] = None) -> Dict:
+        """Create an issue in a repository and return its id, number and url."""
+        mutation = _MUTATION_CREATE_ISSUE
+
+        issue_input = {
+            'repositoryId': repository_id,
+            'title': title,
+            'body': body
+        }
+        if label_ids:
+            issue_input['labelIds'] = label_ids
+        if assignee_ids:
+            issue_input['assigneeIds'] = assignee_ids
+
+        result = self.execute_graphql_query(mutation, {'input': issue_input})
+        return result.get('createIssue', {}).get('issue', {})
+
+    def create_issues_batch(self, issue_inputs: List[Dict]) -> List[Dict]:
+        """Create several issues in a single GraphQL request using aliased mutations.
+
+        Each entry of issue_inputs is a CreateIssueInput dict. Returns the created
+        issues (id, number, url) in the same order.
+        """
+        if not issue_inputs:
+            return []
+
+        variable_defs = ', '.join(f'$i{i}: CreateIssueInput!' for i in range(len(issue_inputs)))
+        fields = '\n'.join(
+            f'i{i}: createIssue(input: $i{i}) {{ issue {{ id number url }} }}'
+            for i in range(len(issue_inputs))
+        )
+        mutation = f"mutation CreateIssues({variable_defs}) {{\n{fields}\n}}"
+
+        variables = {f'i{i}': issue_input for i, issue_input in enumerate(issue_inputs)}
+        result = self.execute_graphql_query(mutation, variables)
+
+        return [result.get(f'i{i}', {}).get('issue', {}) for i in range(len(issue_inputs))]
+
+    def add_issue_to_project(self, project_id: str, issue_id: str) -> str:
+        """Add an issue to a project and return the new project item ID."""
+        mutation = _MUTATION_ADD_TO_PROJECT
+
+        result = self.execute_graphql_query(mutation, {
+            'input': {'projectId': project_id, 'contentId': issue_id}
+        })
+        return result.get('addProjectV2ItemById', {}).get('item', {}).get('id')
+
+    def add_issues_to_project_batch(self, project_id: str, issue_ids: List[str]) -> List[str]:
+        """Add several issues to a project in a single aliased mutation.
+
+        Returns the new project item IDs in the same order as issue_ids.
+        """
+        if not issue_ids:
+            return []
+
+        variable_defs = ', '.join(f'$p{i}: AddProjectV2ItemByIdInput!' for i in range(len(issue_ids)))
+        fields = '\n'.join(
+            f'a{i}: addProjectV2ItemById(input: $p{i}) {{ item {{ id }} }}'
+            for i in range(len(issue_ids))
+        )
+        mutation = f"mutation AddIssuesToProject({variable_defs}) {{\n{fields}\n}}"
+
+        variables = {
+            f'p{i}': {'projectId': project_id, 'contentId': issue_id}
+            for i, issue_id in enumerate(issue_ids)
+        }
+        result = self.execute_graphql_query(mutation, variables)
+
+        return [result.get(f'a{i}', {}).get('item', {}).get('id') for i in range(len(issue_ids))]
+
+    def add_to_project_and_link(self, project_id: str, issue_id: str,
+                                parent_issue_id: str = None) -> str:
+        """Add an issue to a project and optionally link it under a parent.
+
+        Both independent mutations travel in one aliased document, saving a
+        round-trip versus add_issue_to_project + link_as_sub_issue.
+        Returns the new project item ID.
+        """
+        if not parent_issue_id:
+            return self.add_issue_to_project(project_id, issue_id)
+
+        mutation = _MUTATION_ADD_AND_LINK
+
+        result = self.execute_graphql_query(mutation, {
+            'add': {'projectId': project_id, 'contentId': issue_id},
+            'link': {'issueId': parent_issue_id, 'subIssueId': issue_id}
+        })
+        return result.get('addToProject', {}).get('item', {}).get('id')
+
+    def link_as_sub_issue(self, parent_issue_id: str, child_issue_id: str) -> None:
+        """Link an issue as a sub-issue of a parent issue."""
+        mutation = _MUTATION_LINK_SUB_ISSUE
+
+        self.execute_graphql_query(mutation, {
+            'input': {'issueId': parent_issue_id, 'subIssueId': child_issue_id}
+        })
+
+    def link_sub_issues_batch(self, pairs: List[Tuple[str, str]]) -> None:
+        """Link several (parent, child) issue pairs in a single aliased mutation.
+
+        Each pair becomes one addSubIssue entry, so a whole chunk of parent
+        links costs one round-trip instead of one per task.
+        """
+        if not pairs:
+            return
+        if len(pairs) == 1:
+            self.link_as_sub_issue(*pairs[0])
+            return
+
+        variable_defs = ', '.join(f'$l{i}: AddSubIssueInput!' for i in range(len(pairs)))
+        fields = '\n'.join(
+            f'l{i}: addSubIssue(input: $l{i}) {{ subIssue {{ id }} }}'
+            for i in range(len(pairs))
+        )
+        mutation = f"mutation LinkSubIssues({variable_defs}) {{\n{fields}\n}}"
+
+        variables = {
+            f'l{i}': {'issueId': parent_issue_id, 'subIssueId': child_issue_id}
+            for i, (parent_issue_id, child_issue_id) in enumerate(pairs)
         }
+        self.execute_graphql_query(mutation, variables)
+
+    def update_project_field(self, project_id: str, item_id: str, field_id: str, value: str) -> None:
+        """Update a text/single-select project field value for a project item."""
+        mutation = _MUTATION_UPDATE_FIELD
+
+        self.execute_graphql_query(mutation, {
+            'input': {
+                'projectId': project_id,
+                'itemId': item_id,
+                'fieldId': field_id,
+                'value': {'text': value}
+            }
+        })
+
+    def update_project_fields_bulk(self, project_id: str, item_id: str,
+                                   field_values: Dict[str, str]) -> None:
+        """Update several project field values for one item in a single request.
+
+        field_values maps field id to text value; each pair becomes an
+        aliased updateProjectV2ItemFieldValue entry, so N field updates
+        cost one round-trip instead of N.
         """
-        
+        if not field_values:
+            return
+        if len(field_values) == 1:
+            field_id, value = next(iter(field_values.items()))
+            self.update_project_field(project_id, item_id, field_id, value)
+            return
+
+        variable_defs = ', '.join(
+            f'$f{i}: UpdateProjectV2ItemFieldValueInput!' for i in range(len(field_values))
+        )
+        fields = '\n'.join(
+            f'f{i}: updateProjectV2ItemFieldValue(input: $f{i}) {{ projectV2Item {{ id }} }}'
+            for i in range(len(field_values))
+        )
+        mutation = f"mutation UpdateProjectFields({variable_defs}) {{\n{fields}\n}}"
+
         variables = {
-            'projectId': project_id,
-            'first': first
+            f'f{i}': {
+                'projectId': project_id,
+                'itemId': item_id,
+                'fieldId': field_id,
+                'value': {'text': value}
+            }
+            for i, (field_id, value) in enumerate(field_values.items())
         }
-        
-        if after:
-            variables['after'] = after
-        
-        return self.execute_graphql_query(query, variables)
-    
-    def get_all_project_items(self, project_id: str) -> List[Dict]:
-        """Get all items from a project, handling pagination."""
-        all_items = []
-        has_next_page = True
-        after = None
-        
-        while has_next_page:
-            result = self.get_project_items(project_id, first=100, after=after)
-            project_data = result.get('node', {})
-            items_data = project_data.get('items', {})
-            
-            items = items_data.get('nodes', [])
-            all_items.extend(items)
-            
-            page_info = items_data.get('pageInfo', {})
-            has_next_page = page_info.get('hasNextPage', False)
-            after = page_info.get('endCursor')
-        
-        return all_items
-    
-    def filter_items(self, items: List[Dict], filters: Dict) -> List[Dict]:
-        """Filter items based on provided criteria."""
-        filtered_items = []
-        
-        for item in items:
-            content = item.get('content')
-            if content is None:
-                # Skip items with no content (archived or null items)
-                continue
-            
-            # Filter by type
-            if filters.get('type'):
-                item_type = None
-                if 'number' in content and 'repository' in content:
-                    if content.get('merged') is not None:  # PullRequest has merged field
-                        item_type = 'pull_request'
-                    else:
-                        item_type = 'issue'
-                elif 'title' in content and 'creator' in content:
-                    item_type = 'draft_issue'
-                
-                if filters['type'] != item_type:
-                    continue
-            
-            # Filter by status (from field values)
-            if filters.get('status'):
-                status_found = False
-                for field_value in item.get('fieldValues', {}).get('nodes', []):
-                    field = field_value.get('field', {})
-                    if field.get('name', '').lower() == 'status':
-                        if field_value.get('name', '').lower() == filters['status'].lower():
-                            status_found = True
-                            break
-                
-                if filters['status'] and not status_found:
-                    continue
-            
-            # Filter by assignee
-            if filters.get('assignee'):
-                assignees = []
-                if 'assignees' in content:
-                    assignees = [a['login'] for a in content['assignees'].get('nodes', [])]
-                
-                if filters['assignee'] not in assignees:
-                    continue
-            
-            # Filter by label
-            if filters.get('label'):
-                labels = []
-                if 'labels' in content:
-                    labels = [l['name'].lower() for l in content['labels'].get('nodes', [])]
-                
-                # Case-insensitive label matching
-                if filters['label'].lower() not in labels:
-                    continue
-            
-            filtered_items.append(item)
-        
-        return filtered_items
-    
-    def parse_item_data(self, item: Dict) -> Dict:
-        """Parse item data into a standardized format."""
-        content = item.get('content')
-        if content is None:
-            content = {}
-        
-        parsed = {
-            'id': item.get('id'),
-            'type': 'unknown',
-            'title': '',
-            'body': '',
-            'url': '',
-            'state': '',
-            'author': '',
-            'assignees': [],
-            'labels': [],
-            'repository': '',
-            'number': None,  # GitHub issue/PR number
-            'parent': None,  # Parent issue information
-            'sub_issues': [],  # List of sub-issues
-            'sub_issues_summary': None,  # Summary of sub-issues
-            'created_at': content.get('createdAt', '') if content else '',
-            'updated_at': content.get('updatedAt', '') if content else '',
-            'project_fields': {}
+        self.execute_graphql_query(mutation, variables)
+
+    def update_project_fields_batch(self, project_id: str,
+                                    updates: List[Tuple[str, str, str]]) -> None:
+        """Update project field values across several items in one request.
+
+        Each entry of updates is an (item_id, field_id, value) triple; unlike
+        update_project_fields_bulk this spans items, so one chunk's worth of
+        field updates travels as a single aliased mutation document.
+        """
+        if not updates:
+            return
+
+        variable_defs = ', '.join(
+            f'$f{i}: UpdateProjectV2ItemFieldValueInput!' for i in range(len(updates))
+        )
+        fields = '\n'.join(
+            f'f{i}: updateProjectV2ItemFieldValue(input: $f{i}) {{ projectV2Item {{ id }} }}'
+            for i in range(len(updates))
+        )
+        mutation = f"mutation UpdateProjectFieldsBatch({variable_defs}) {{\n{fields}\n}}"
+
+        variables = {
+            f'f{i}': {
+                'projectId': project_id,
+                'itemId': item_id,
+                'fieldId': field_id,
+                'value': {'text': value}
+            }
+            for i, (item_id, field_id, value) in enumerate(updates)
         }
-        
-        # Determine type and parse content
-        if content and 'number' in content and 'repository' in content:
-            if content.get('merged') is not None:
-                parsed['type'] = 'pull_request'
-                parsed['state'] = 'merged' if content.get('merged') else content.get('state', '')
-            else:
-                parsed['type'] = 'issue'
-                parsed['state'] = content.get('state', '')
-            
-            parsed['title'] = content.get('title', '')
-            parsed['body'] = content.get('body', '') or ''
-            parsed['url'] = content.get('url', '')
-            parsed['number'] = content.get('number')
-            parsed['author'] = content.get('author', {}).get('login', '')
-            parsed['assignees'] = [a['login'] for a in content.get('assignees', {}).get('nodes', [])]
-            parsed['labels'] = [{'name': l['name'], 'color': l['color']} for l in content.get('labels', {}).get('nodes', [])]
-            
-            # Capture parent-child relationships
-            if content.get('parent'):
-                parsed['parent'] = {
-                    'id': content['parent']['id'],
-                    'title': content['parent'].get('title', ''),
-                    'number': content['parent'].get('number')
-                }
-            
-            if content.get('subIssues', {}).get('nodes'):
-                parsed['sub_issues'] = [
-                    {
-                        'id': sub['id'],
-                        'title': sub.get('title', ''),
-                        'number': sub.get('number')
-                    }
-                    for sub in content['subIssues']['nodes']
-                ]
-            
-            if content.get('subIssuesSummary'):
-                parsed['sub_issues_summary'] = content['subIssuesSummary']
-            
-            repo = content.get('repository', {})
-            owner = repo.get('owner', {}).get('login', '')
-            repo_name = repo.get('name', '')
-            parsed['repository'] = f"{owner}/{repo_name}" if owner and repo_name else ''
-            
-        elif content and 'title' in content and 'creator' in content:
-            parsed['type'] = 'draft_issue'
-            parsed['title'] = content.get('title', '')
-            parsed['body'] = content.get('body', '') or ''
-            parsed['author'] = content.get('creator', {}).get('login', '')
-            parsed['assignees'] = [a['login'] for a in content.get('assignees', {}).get('nodes', [])]
-        
-        # Parse project fields
-        for field_value in item.get('fieldValues', {}).get('nodes', []):
-            field = field_value.get('field', {})
-            field_name = field.get('name', '')
-            
-            if 'text' in field_value:
-                parsed['project_fields'][field_name] = field_value['text']
-            elif 'number' in field_value:
-                parsed['project_fields'][field_name] = field_value['number']
-            elif 'name' in field_value:
-                parsed['project_fields'][field_name] = field_value['name']
-            elif 'date' in field_value:
-                parsed['project_fields'][field_name] = field_value['date']
-            elif 'title' in field_value:  # Iteration field
-                parsed['project_fields'][field_name] = field_value['title']
-        
-        return parsed
+        self.execute_graphql_query(mutation, variables)
 
 
 def display_as_relationship_tree(items: List[Dict], project_info: Dict, show_description: bool = False):
@@ -498,29 +1548,61 @@ def display_as_relationship_tree(items: List[Dict], project_info: Dict, show_des
         display_flat_task_list(items, show_description)
         return
     
+    # One id -> item map instead of a linear scan per root/orphan/child;
+    # built once by build_task_relationships and shared here
+    by_id = relationships['by_id']
+    
     # Display root tasks and their children
     if relationships['roots']:
         for root_id in relationships['roots']:
-            root_task = next((item for item in items if item['id'] == root_id), None)
+            root_task = by_id.get(root_id)
             if root_task:
-                display_task_subtree(root_task, relationships['children'], items, level=0, show_description=show_description)
+                display_task_subtree(root_task, relationships['children'], by_id, level=0, show_description=show_description)
     
     # Display orphaned tasks (no clear parent/child relationship)
     if relationships['orphans']:
         print(f"\n📄 Independent Tasks ({len(relationships['orphans'])} items):")
         for orphan_id in relationships['orphans']:
-            orphan_task = next((item for item in items if item['id'] == orphan_id), None)
+            orphan_task = by_id.get(orphan_id)
             if orphan_task:
                 display_single_task(orphan_task, prefix="├── ", show_description=show_description)
-def display_as_table(items: List[Dict], project_info: Dict, show_description: bool = False):
-    """Display items as a formatted table."""
-    if not TABULATE_AVAILABLE:
+def _render_table(headers: List[str], rows: List[List[str]]):
+    """Render a plain table with one width pass and a single buffered write.
+
+    Unlike tabulate (which scans every cell twice and formats through
+    several layers), this tracks the max width per column while rows
+    stream in, then joins everything into one sys.stdout.write.
+    """
+    widths = [len(h) for h in headers]
+    for row in rows:
+        for i, cell in enumerate(row):
+            if len(cell) > widths[i]:
+                widths[i] = len(cell)
+
+    lines = ['  '.join(h.ljust(w) for h, w in zip(headers, widths)),
+             '  '.join('-' * w for w in widths)]
+    lines.extend(
+        '  '.join(cell.ljust(w) for cell, w in zip(row, widths))
+        for row in rows
+    )
+    lines.append('')
+    sys.stdout.write('\n'.join(lines))
+
+
+def display_as_table(items: List[Dict], project_info: Dict, show_description: bool = False,
+                     pretty: bool = False):
+    """Display items as a formatted table.
+
+    The default renderer is the dependency-free _render_table; pretty=True
+    selects tabulate's grid format (--output table-pretty).
+    """
+    if pretty and not TABULATE_AVAILABLE:
         raise ImportError(
-            "The 'tabulate' package is required for table output format.\n"
+            "The 'tabulate' package is required for the table-pretty output format.\n"
             "Install it with: pip install tabulate>=0.9.0\n"
-            "Or use a different output format: --output json, --output tree, or --output status-groups"
+            "Or use a different output format: --output table, json, tree, or status-groups"
         )
-    
+
     print(f"\n🎯 Project: {project_info['title']}")
     print(f"📄 Description: {project_info.get('shortDescription', 'N/A')}")
     print(f"🔗 URL: {project_info['url']}")
@@ -553,20 +1635,23 @@ def display_as_table(items: List[Dict], project_info: Dict, show_description: bo
             item['state'].title(),
             item['author'],
             assignees_str,
-            status
+            str(status)
         ]
         
         if show_description:
-            description = item.get('body', '') or ''
-            # Truncate long descriptions and replace newlines
-            description = description.replace('\n', ' ').replace('\r', ' ')
+            # Flatten newlines in one pass and truncate long descriptions
+            description = (item.get('body') or '').translate(_NL_TRANS)
             if len(description) > 100:
                 description = description[:97] + '...'
             row.append(description or 'N/A')
         
         table_data.append(row)
     
-    print(tabulate(table_data, headers=headers, tablefmt='grid'))
+    if pretty:
+        # Every cell is already a string; numeric re-parsing is wasted work
+        print(tabulate(table_data, headers=headers, tablefmt='grid', disable_numparse=True))
+    else:
+        _render_table(headers, table_data)
 
 
 def display_as_status_groups(items: List[Dict], project_info: Dict, show_description: bool = False):
@@ -603,116 +1688,119 @@ def display_as_status_groups(items: List[Dict], project_info: Dict, show_descrip
 
 def build_task_relationships(items: List[Dict]) -> Dict:
     """Build task relationships using project-specific patterns and field matching."""
+    # Adjacency-list layout: flat id-keyed maps instead of chasing nested
+    # parent/sub_issues dicts during display
     relationships = {
         'children': {},  # parent_id -> [child_ids]
         'parents': {},   # child_id -> parent_id
         'roots': [],     # tasks that are parents but not children (root issues)
-        'orphans': []    # tasks with no clear relationships
+        'orphans': [],   # tasks with no clear relationships
+        'by_id': {}      # item_id -> item, shared with the display pass
     }
-    
-    # Create lookup maps for items by their ID and by issue number  
+
+    # First pass: lookup maps for items by their ID and by issue number
     id_to_item = {item['id']: item for item in items}
+    relationships['by_id'] = id_to_item
     # Map issue numbers to project item IDs (for matching parent/child relationships)
     number_to_id = {item['number']: item['id'] for item in items if item.get('number')}
-    
-    # First, try GitHub's native parent-child relationships (for real issues)
+
+    parents = relationships['parents']
+    # Children are collected in insertion-ordered dicts (used as ordered
+    # sets): membership is O(1) instead of a linear list scan per edge,
+    # without scrambling the display order the way a plain set would
+    children_sets = {}
+
+    # Second pass: GitHub's native parent-child relationships (for real issues)
     for item in items:
         item_id = item['id']
-        
+
         # If this item has a parent, establish the relationship by matching issue numbers
-        if item.get('parent') and item['parent'].get('number'):
-            parent_number = item['parent']['number']
+        parent = item.get('parent')
+        parent_number = parent.get('number') if parent else None
+        if parent_number:
             parent_id = number_to_id.get(parent_number)
-            
+
             # Only add relationship if the parent is also in our project items
             if parent_id:
-                if parent_id not in relationships['children']:
-                    relationships['children'][parent_id] = []
-                if item_id not in relationships['children'][parent_id]:
-                    relationships['children'][parent_id].append(item_id)
-                relationships['parents'][item_id] = parent_id
-        
+                children_sets.setdefault(parent_id, {})[item_id] = None
+                parents[item_id] = parent_id
+
         # If this item has sub-issues, establish those relationships
-        if item.get('sub_issues'):
-            for sub_issue in item['sub_issues']:
+        sub_issues = item.get('sub_issues')
+        if sub_issues:
+            own_children = None
+            for sub_issue in sub_issues:
                 sub_number = sub_issue.get('number')
                 sub_id = number_to_id.get(sub_number) if sub_number else None
-                
+
                 # Only add relationship if the sub-issue is also in our project items
                 if sub_id:
-                    if item_id not in relationships['children']:
-                        relationships['children'][item_id] = []
-                    if sub_id not in relationships['children'][item_id]:
-                        relationships['children'][item_id].append(sub_id)
+                    if own_children is None:
+                        own_children = children_sets.setdefault(item_id, {})
+                    own_children[sub_id] = None
                     # Only set parent if not already set (prefer explicit parent relationship)
-                    if sub_id not in relationships['parents']:
-                        relationships['parents'][sub_id] = item_id
+                    if sub_id not in parents:
+                        parents[sub_id] = item_id
+
+    # Materialize the ordered de-dup sets into plain child-id lists
+    if children_sets:
+        relationships['children'] = {pid: list(ids) for pid, ids in children_sets.items()}
     
     # For projects without native GitHub relationships, use project-specific patterns
     if not relationships['children'] and not relationships['parents']:
-        # Separate requirements and test cases
+        # Separate requirements from test cases and group the tests by
+        # their Test ID field in a single pass: each item's project_fields
+        # dict is fetched and probed once instead of once per bucket
         requirements = []  # Items with 'Acceptance' field
         test_cases = []    # Items with 'Test type' field
-        others = []        # Other items
-        
+        test_id_groups = {}  # Test ID field value -> [test items]
+
         for item in items:
-            fields = item.get('project_fields', {})
+            fields = item.get('project_fields') or {}
             if 'Acceptance' in fields:
                 requirements.append(item)
             elif 'Test type' in fields:
                 test_cases.append(item)
-            else:
-                others.append(item)
-        
+                group_id = fields.get('Test ID', '')
+                if group_id:
+                    test_id_groups.setdefault(group_id, []).append(item)
+
+        # Inverted index: significant title token -> test ids containing it.
+        # Each requirement then probes only its own tokens instead of
+        # re-tokenizing every test, turning the O(reqs x tests) scan into
+        # one linear in total token occurrences.
+        token_to_tests = {}
+        test_pos = {}
+        for pos, test in enumerate(test_cases):
+            test_id = test['id']
+            test_pos[test_id] = pos
+            for token in set(test['title'].lower().split()):
+                if len(token) > 3:
+                    token_to_tests.setdefault(token, []).append(test_id)
+
         # Build relationships: Requirements as parents, Test cases as children
         for req in requirements:
             req_id = req['id']
             req_title = req['title'].lower()
-            
-            # Find related test cases by semantic matching
-            related_tests = []
-            for test in test_cases:
-                test_title = test['title'].lower()
-                
-                # Try to match based on common keywords
-                if test_title and req_title:
-                    # Extract key terms from requirement title
-                    req_terms = set(req_title.split())
-                    test_terms = set(test_title.split())
-                    
-                    # Calculate overlap
-                    common_terms = req_terms.intersection(test_terms)
-                    significant_terms = [term for term in common_terms if len(term) > 3]
-                    
-                    # If there are significant matching terms, consider them related
-                    if len(significant_terms) >= 1:
-                        related_tests.append(test['id'])
-            
-            # Also group test cases by Test ID field
-            test_id_groups = {}
-            for test in test_cases:
-                test_id = test.get('project_fields', {}).get('Test ID', '')
-                if test_id:
-                    if test_id not in test_id_groups:
-                        test_id_groups[test_id] = []
-                    test_id_groups[test_id].append(test['id'])
-            
+
+            # Find related test cases: any significant term shared with a
+            # test title makes them related (duplicate terms probe once)
+            candidates = set()
+            for term in set(req_title.split()):
+                if len(term) > 3:
+                    candidates.update(token_to_tests.get(term, ()))
+
+            # Preserve the original test order in the children list
+            related_tests = sorted(candidates, key=test_pos.__getitem__)
+
             # If we found related tests, establish relationships
             if related_tests:
                 relationships['children'][req_id] = related_tests
                 for test_id in related_tests:
                     relationships['parents'][test_id] = req_id
-        
+
         # Group test cases by Test ID if no semantic relationships were found
-        if not relationships['children'] and test_cases:
-            test_id_groups = {}
-            for test in test_cases:
-                test_id = test.get('project_fields', {}).get('Test ID', '')
-                if test_id:
-                    if test_id not in test_id_groups:
-                        test_id_groups[test_id] = []
-                    test_id_groups[test_id].append(test)
-            
+        if not relationships['children'] and test_id_groups:
             # Create virtual parent nodes for each test group
             for test_id, tests in test_id_groups.items():
                 if len(tests) > 1:  # Only group if there are multiple tests
@@ -726,107 +1814,121 @@ def build_task_relationships(items: List[Dict]) -> Dict:
                         for child_id in child_ids:
                             relationships['parents'][child_id] = parent_id
     
-    # Identify root tasks (items that have children but no parents within the project)
-    # A task is a "root" if it has children AND no parent in the project
-    for item in items:
-        item_id = item['id']
-        has_children_in_project = item_id in relationships['children']
-        has_parent_in_project = item_id in relationships['parents']
-        
-        # Task is a root if it has actual children relationships established
-        if has_children_in_project and not has_parent_in_project:
-            relationships['roots'].append(item_id)
-    
-    # Identify orphans (items with no parent-child relationships in the project)
-    for item in items:
-        item_id = item['id']
-        has_children_in_project = item_id in relationships['children']
-        has_parent_in_project = item_id in relationships['parents']
-        
-        # Task is an orphan only if it has no relationships at all
-        if not has_children_in_project and not has_parent_in_project:
-            relationships['orphans'].append(item_id)
-    
+    # Roots have children but no parent; orphans have neither. Both are
+    # plain set differences over the maps built above (C-level set ops
+    # instead of two per-item membership loops), sorted back into item
+    # order so the display stays deterministic
+    child_ids = relationships['children'].keys()
+    parent_ids = relationships['parents'].keys()
+    order = {item_id: pos for pos, item_id in enumerate(id_to_item)}
+    relationships['roots'] = sorted(child_ids - parent_ids, key=order.__getitem__)
+    relationships['orphans'] = sorted(order.keys() - child_ids - parent_ids,
+                                      key=order.__getitem__)
+
     return relationships
 
 
-def find_task_by_title_match(items: List[Dict], search_text: str) -> Optional[Dict]:
+def prepare_search_columns(items: List[Dict]):
+    """Precompute the title columns shared by the matching helpers.
+
+    Returns (lower_titles, token_sets, id_index, title_index): parallel
+    arrays of each item's lowercased title and title-token set, item id ->
+    position, and lowercased title -> first position for exact lookups.
+    Compute once per item list and pass to repeated matching calls so
+    titles are lowercased and tokenized exactly once.
+    """
+    lower_titles = [item['title'].lower() for item in items]
+    token_sets = [frozenset(title.split()) for title in lower_titles]
+    id_index = {item['id']: i for i, item in enumerate(items)}
+    title_index = {}
+    for i, title in enumerate(lower_titles):
+        title_index.setdefault(title, i)
+    return lower_titles, token_sets, id_index, title_index
+
+
+def find_task_by_title_match(items: List[Dict], search_text: str,
+                             columns=None) -> Optional[Dict]:
     """Find a task by matching title text."""
     search_text_lower = search_text.lower().strip()
-    for item in items:
-        if search_text_lower in item['title'].lower() or item['title'].lower() in search_text_lower:
-            return item
-    return None
+    if columns:
+        lower_titles = columns[0]
+        # An exact title hit bounds the substring scan: only an earlier
+        # item could still win, so repeated exact lookups are O(hit pos)
+        exact_pos = columns[3].get(search_text_lower)
+    else:
+        lower_titles = [item['title'].lower() for item in items]
+        exact_pos = None
+    stop = exact_pos if exact_pos is not None else len(lower_titles)
+    for i in range(stop):
+        title = lower_titles[i]
+        if search_text_lower in title or title in search_text_lower:
+            return items[i]
+    return items[exact_pos] if exact_pos is not None else None
 
 
-def find_potential_children(parent_task: Dict, items: List[Dict]) -> List[str]:
+def find_potential_children(parent_task: Dict, items: List[Dict],
+                            columns=None) -> List[str]:
     """Find potential child tasks based on title similarity and patterns."""
+    if columns is None:
+        columns = prepare_search_columns(items)
+    token_sets = columns[1]
+
     children = []
     parent_title = parent_task['title'].lower()
     parent_id = parent_task['id']
-    
+
     # Extract key terms from parent title (remove common words)
-    common_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'shall', 'have', 'means'}
-    parent_terms = [word for word in parent_title.split() if word not in common_words and len(word) > 2]
-    
-    for item in items:
+    parent_terms = tuple(word for word in parent_title.split()
+                         if word not in _COMMON_WORDS and len(word) > 2)
+    parent_term_set = frozenset(parent_terms)
+    threshold = min(2, len(parent_terms) // 2)
+
+    for item, tokens in zip(items, token_sets):
         if item['id'] == parent_id:
             continue
-            
-        item_title = item['title'].lower()
-        
-        # Check if item title contains key terms from parent
-        matching_terms = sum(1 for term in parent_terms if term in item_title)
-        
-        # If significant overlap in terms, consider it a potential child
-        if matching_terms >= min(2, len(parent_terms) // 2):
+
+        # If significant term overlap, consider it a potential child
+        if len(parent_term_set & tokens) >= threshold:
             children.append(item['id'])
-    
+
     return children
 
 
-def display_task_subtree(task: Dict, children_map: Dict, all_items: List[Dict], level: int = 0, show_description: bool = False):
-    """Display a task and its subtree recursively."""
-    indent = "    " * level
-    prefix = "└── " if level > 0 else "│ "
-    
-    display_single_task(task, prefix=indent + prefix, show_description=show_description, in_tree_view=True)
-    
-    # Display children
-    task_children = children_map.get(task['id'], [])
-    for i, child_id in enumerate(task_children):
-        child_task = next((item for item in all_items if item['id'] == child_id), None)
-        if child_task:
-            display_task_subtree(child_task, children_map, all_items, level + 1, show_description=show_description)
+def display_task_subtree(task: Dict, children_map: Dict, by_id: Dict, level: int = 0, show_description: bool = False):
+    """Display a task and its subtree depth-first.
+
+    by_id maps item id -> item so each child is an O(1) lookup rather than a
+    scan over the whole item list. The walk is iterative with an explicit
+    stack: no per-node Python frame, and no recursion limit on deep trees.
+    """
+    stack = [(task, level)]
+    while stack:
+        node, lvl = stack.pop()
+        indent = "    " * lvl
+        prefix = "└── " if lvl > 0 else "│ "
+        display_single_task(node, prefix=indent + prefix, show_description=show_description, in_tree_view=True)
+
+        # Push children reversed so they pop in original order
+        for child_id in reversed(children_map.get(node['id'], ())):
+            child_task = by_id.get(child_id)
+            if child_task:
+                stack.append((child_task, lvl + 1))
 
 
 def display_single_task(task: Dict, prefix: str = "├── ", show_description: bool = False, in_tree_view: bool = False):
     """Display a single task with its details."""
-    # Determine icon based on labels first, then fall back to item type
-    icon = None
-    if task.get('labels'):
-        # Check labels for specific types (case-insensitive)
-        label_names = [label['name'].lower() for label in task['labels']]
-        
-        # Priority order: more specific labels first
-        if any('bug' in name for name in label_names):
-            icon = '🐛'
-        elif any('test case' in name or 'test' in name for name in label_names):
-            icon = '🧪'
-        elif any('requirement' in name for name in label_names):
-            icon = '📋'
-        elif any('feature' in name for name in label_names):
-            icon = '✨'
-        elif any('dev' in name or 'development' in name for name in label_names):
-            icon = '⚙️'
-    
-    # Fall back to item type icon if no label-based icon was found
-    if not icon:
-        icon = {
-            'issue': '�',
-            'pull_request': '🔀',
-            'draft_issue': '📝'
-        }.get(task['type'], '📄')
+    # Start from the item-type icon; a recognized label keyword overrides it
+    icon = _TYPE_ICONS.get(task['type'], '📄')
+    labels = task.get('labels')
+    if labels:
+        # One joined lowercase string makes each keyword test a single
+        # C-level substring search instead of a Python-level scan over
+        # the labels; first hit wins (most specific keywords first)
+        joined_labels = ' '.join(labels).lower()
+        for keyword, label_icon in _LABEL_ICONS:
+            if keyword in joined_labels:
+                icon = label_icon
+                break
     
     # Build task line with issue number if available
     task_line = f"{prefix}{icon} {task['title']}"
@@ -834,71 +1936,103 @@ def display_single_task(task: Dict, prefix: str = "├── ", show_description
         task_line += f" #{task['number']}"
     if task['repository']:
         task_line += f" ({task['repository']})"
-    
-    print(task_line)
-    
+
+    # Collect the whole task block and emit it as a single write rather
+    # than one syscall-prone print per detail line
+    out = [task_line]
+    detail_prefix = "    " + prefix.replace("├── ", "│   ").replace("└── ", "    ")
+
     # Show description if requested or if it's a test case (always show for test cases)
     is_test_case = 'verify that' in task['title'].lower() or 'test case' in task['title'].lower()
     should_show_desc = show_description or is_test_case
-    
+
     if should_show_desc and task.get('body'):
-        detail_prefix = "    " + prefix.replace("├── ", "│   ").replace("└── ", "    ")
         body_lines = task['body'].strip().split('\n')
         if body_lines:
-            print(f"{detail_prefix}📝 Description:")
-            
+            out.append(f"{detail_prefix}📝 Description:")
+
             for line in body_lines:
                 if line.strip():
                     line_text = line.strip()
-                    print(f"{detail_prefix}   {line_text}")
+                    out.append(f"{detail_prefix}   {line_text}")
                 else:
                     # Show empty lines within the content
-                    print(f"{detail_prefix}   ")
-    
-    # Add details with proper indentation
-    detail_prefix = "    " + prefix.replace("├── ", "│   ").replace("└── ", "    ")
-    
+                    out.append(f"{detail_prefix}   ")
+
     if task['author']:
-        print(f"{detail_prefix}👤 Author: {task['author']}")
-    
+        out.append(f"{detail_prefix}👤 Author: {task['author']}")
+
     if task['assignees']:
         assignees_str = ', '.join(task['assignees'])
-        print(f"{detail_prefix}👥 Assignees: {assignees_str}")
-    
+        out.append(f"{detail_prefix}👥 Assignees: {assignees_str}")
+
     if task['state']:
-        print(f"{detail_prefix}🏷️  State: {task['state'].title()}")
-    
+        out.append(f"{detail_prefix}🏷️  State: {task['state'].title()}")
+
     # Show labels if available
     if task.get('labels'):
-        labels_str = ', '.join([f"{label['name']}" for label in task['labels']])
-        print(f"{detail_prefix}🏷  Labels: {labels_str}")
-    
+        labels_str = ', '.join(task['labels'])
+        out.append(f"{detail_prefix}🏷  Labels: {labels_str}")
+
     # Show sub-issues summary if available
     if task.get('sub_issues_summary'):
         summary = task['sub_issues_summary']
         total = summary.get('total', 0)
         completed = summary.get('completed', 0)
         percent = summary.get('percentCompleted', 0)
-        print(f"{detail_prefix}📊 Sub-issues: {completed}/{total} completed ({percent}%)")
-    
+        out.append(f"{detail_prefix}📊 Sub-issues: {completed}/{total} completed ({percent}%)")
+
     # Show parent issue if available (but not in tree view where structure shows it)
     if task.get('parent') and not in_tree_view:
         parent_title = task['parent'].get('title', 'Unknown')
         parent_number = task['parent'].get('number', '')
         parent_ref = f"#{parent_number}" if parent_number else ""
-        print(f"{detail_prefix}⬆️  Parent: {parent_title} {parent_ref}")
-    
+        out.append(f"{detail_prefix}⬆️  Parent: {parent_title} {parent_ref}")
+
     status = task['project_fields'].get('Status')
     if status:
-        print(f"{detail_prefix}📌 Status: {status}")
-    
+        out.append(f"{detail_prefix}📌 Status: {status}")
+
     # Show other important project fields (excluding Title which is already shown)
     for field_name, field_value in task['project_fields'].items():
-        if field_name not in ['Status', 'Title'] and field_value and len(str(field_value)) < 100:
-            print(f"{detail_prefix}📌 {field_name}: {field_value}")
-    
+        if field_name in ('Status', 'Title') or not field_value:
+            continue
+        text = str(field_value)
+        if len(text) < 100:
+            out.append(f"{detail_prefix}📌 {field_name}: {text}")
+
     if task['url']:
-        print(f"{detail_prefix}🔗 {task['url']}")
+        out.append(f"{detail_prefix}🔗 {task['url']}")
+
+    out.append('')
+    sys.stdout.write('\n'.join(out))
+
+
+def _json_default(obj):
+    """orjson fallback: tuples become arrays, anything else its str form."""
+    if isinstance(obj, tuple):
+        return list(obj)
+    return str(obj)
+
+
+def _stream_json_output(project_info: Dict, items: List[Dict], filters: Dict, fp):
+    """Stream the JSON export to a binary file object with orjson.
+
+    The export of a large project runs to tens of MB; writing the items
+    array one element at a time keeps peak memory at one encoded item
+    instead of the whole document as a single Python string.
+    """
+    fp.write(b'{"project":')
+    fp.write(orjson.dumps(project_info, default=_json_default))
+    fp.write(b',"items":[')
+    for i, item in enumerate(items):
+        if i:
+            fp.write(b',')
+        fp.write(orjson.dumps(item, default=_json_default))
+    fp.write(b'],"total_count":%d,"filters_applied":' % len(items))
+    fp.write(orjson.dumps(filters, default=_json_default))
+    fp.write(b'}\n')
+    fp.flush()
 
 
 def display_flat_task_list(items: List[Dict], show_description: bool = False):
@@ -909,11 +2043,9 @@ def display_flat_task_list(items: List[Dict], show_description: bool = False):
         display_single_task(item, prefix=prefix, show_description=show_description)
 
 
-def main():
-    parser = argparse.ArgumentParser(
-        description='Retrieve tasks from a GitHub project with filtering and tree view capabilities',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+# Built once; main() only parses against it. Kept out of module import so
+# importers (e.g. the MCP server) never pay for CLI setup.
+_CLI_EPILOG = """
 Examples:
   %(prog)s --token ghp_xxxx --org 4d --project-id 745
   %(prog)s --token ghp_xxxx --org 4d --project-id 745 --type issue
@@ -925,13 +2057,22 @@ Examples:
 
 Environment variables:
   GITHUB_TOKEN    GitHub Personal Access Token (alternative to --token)
+  GITHUB_TOKENS   Comma-separated tokens to rotate across for higher rate limits
   GITHUB_ORG      GitHub organization name (alternative to --org)
         """
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser."""
+    parser = argparse.ArgumentParser(
+        description='Retrieve tasks from a GitHub project with filtering and tree view capabilities',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_CLI_EPILOG
     )
-    
+
     parser.add_argument(
         '--token',
-        help='GitHub Personal Access Token with repo and project permissions (can also use GITHUB_TOKEN env var)'
+        help='GitHub Personal Access Token(s), comma-separated to rotate across several (can also use GITHUB_TOKEN or GITHUB_TOKENS env var)'
     )
     
     parser.add_argument(
@@ -948,23 +2089,22 @@ Environment variables:
     
     parser.add_argument(
         '--type',
-        choices=['issue', 'pull_request', 'draft_issue'],
-        help='Filter by item type'
+        help='Filter by item type(s), comma-separated (issue, pull_request, draft_issue)'
     )
-    
+
     parser.add_argument(
         '--status',
         help='Filter by status field value (case-insensitive)'
     )
-    
+
     parser.add_argument(
         '--assignee',
-        help='Filter by assignee username'
+        help='Filter by assignee username(s), comma-separated'
     )
-    
+
     parser.add_argument(
         '--label',
-        help='Filter by label name (case-insensitive)'
+        help='Filter by label name(s), comma-separated (case-insensitive)'
     )
     
     parser.add_argument(
@@ -987,9 +2127,9 @@ Environment variables:
     
     parser.add_argument(
         '--output',
-        choices=['table', 'tree', 'json', 'status-groups'],
+        choices=['table', 'table-pretty', 'tree', 'json', 'status-groups'],
         default='table',
-        help='Output format (default: table)'
+        help='Output format (default: table; table-pretty uses tabulate grid borders)'
     )
     
     parser.add_argument(
@@ -997,11 +2137,42 @@ Environment variables:
         action='store_true',
         help='Suppress progress messages'
     )
-    
+
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Disable the on-disk conditional-request cache'
+    )
+
+    parser.add_argument(
+        '--refresh',
+        action='store_true',
+        help='Re-fetch project items instead of reusing the local snapshot'
+    )
+
+    parser.add_argument(
+        '--cache-ttl',
+        type=int,
+        default=None,
+        help=f'Cached-response lifetime in seconds (default: {ETAG_CACHE_TTL})'
+    )
+
+    return parser
+
+
+def main():
+    parser = _build_parser()
     args = parser.parse_args()
-    
-    # Get token from argument or environment variable
-    token = args.token or os.getenv('GITHUB_TOKEN')
+
+    if args.type:
+        valid_types = {'issue', 'pull_request', 'draft_issue'}
+        invalid = [t.strip() for t in args.type.split(',') if t.strip() not in valid_types]
+        if invalid:
+            parser.error(f"invalid --type value(s): {', '.join(invalid)} "
+                         f"(choose from {', '.join(sorted(valid_types))})")
+
+    # Get token(s) from argument or environment variable
+    token = args.token or os.getenv('GITHUB_TOKENS') or os.getenv('GITHUB_TOKEN')
     if not token:
         print("Error: GitHub token is required. Provide it via --token argument or GITHUB_TOKEN environment variable.")
         print("The token needs 'repo' and 'project' permissions.")
@@ -1015,7 +2186,11 @@ Environment variables:
     
     try:
         # Initialize manager
-        manager = GitHubProjectManager(token)
+        manager = GitHubProjectManager(
+            token,
+            cache_enabled=not args.no_cache,
+            cache_ttl=args.cache_ttl
+        )
         
         if not args.quiet:
             print(f"🔍 Fetching project {args.project_id} from organization {org}...")
@@ -1027,11 +2202,44 @@ Environment variables:
             print(f"📋 Found project: {project_info['title']}")
             print(f"🔄 Fetching all project items...")
         
-        # Get all project items
-        items = manager.get_all_project_items(project_info['id'])
-        
-        if not args.quiet:
-            print(f"✅ Retrieved {len(items)} items")
+        # Fetch only the payload the chosen output actually needs
+        show_description = getattr(args, 'show_description', False)
+        tree_mode = args.tree or args.output == 'tree'
+        json_mode = args.output == 'json'
+
+        include_body = show_description or json_mode
+        include_sub_issues = tree_mode or json_mode
+        include_parent = tree_mode or json_mode
+        # Committing to a single --type lets the query drop the other
+        # content fragments entirely
+        wanted_types = [t.strip() for t in args.type.split(',')] if args.type else []
+        type_hint = wanted_types[0] if len(wanted_types) == 1 else None
+
+        # Serve repeat runs from the local snapshot; --refresh re-fetches
+        items = None
+        if not args.refresh:
+            items = manager.load_items_snapshot(
+                project_info['id'], include_body, include_sub_issues, include_parent,
+                type_hint=type_hint, watermark=project_info.get('updatedAt')
+            )
+            if items is not None and not args.quiet:
+                print(f"✅ Loaded {len(items)} items from local snapshot (--refresh to re-fetch)")
+
+        if items is None:
+            items = manager.get_all_project_items(
+                project_info['id'],
+                include_body=include_body,
+                include_sub_issues=include_sub_issues,
+                include_parent=include_parent,
+                type_hint=type_hint
+            )
+            manager.save_items_snapshot(
+                project_info['id'], items, include_body, include_sub_issues, include_parent,
+                type_hint=type_hint, watermark=project_info.get('updatedAt')
+            )
+
+            if not args.quiet:
+                print(f"✅ Retrieved {len(items)} items")
         
         # Apply filters
         filters = {}
@@ -1047,29 +2255,37 @@ Environment variables:
         if filters:
             if not args.quiet:
                 print(f"🔍 Applying filters: {filters}")
-            items = manager.filter_items(items, filters)
+            # One pass: items that fail a filter are never parsed
+            parsed_items = manager.filter_items(items, filters, parse=True)
             if not args.quiet:
-                print(f"✅ {len(items)} items after filtering")
-        
-        # Parse items
-        parsed_items = [manager.parse_item_data(item) for item in items]
+                print(f"✅ {len(parsed_items)} items after filtering")
+        else:
+            parsed_items = [manager.parse_item_data(item) for item in items]
         
         # Output results
-        show_description = getattr(args, 'show_description', False)
         if args.output == 'json':
-            output_data = {
-                'project': project_info,
-                'items': parsed_items,
-                'total_count': len(parsed_items),
-                'filters_applied': filters
-            }
-            print(json.dumps(output_data, indent=2, default=str))
+            if ORJSON_AVAILABLE:
+                # Stream item-by-item straight to the byte buffer
+                _stream_json_output(project_info, parsed_items, filters, sys.stdout.buffer)
+            else:
+                output_data = {
+                    'project': project_info,
+                    'items': parsed_items,
+                    'total_count': len(parsed_items),
+                    'filters_applied': filters
+                }
+                # Compact separators match the orjson path and skip the
+                # indent pass, which dominates stdlib dumps on big exports
+                sys.stdout.write(json.dumps(output_data, separators=(',', ':'),
+                                            default=str))
+                sys.stdout.write('\n')
         elif args.output == 'tree' or args.tree:
             display_as_relationship_tree(parsed_items, project_info, show_description)
         elif args.output == 'status-groups' or args.group_by_status:
             display_as_status_groups(parsed_items, project_info, show_description)
         else:
-            display_as_table(parsed_items, project_info, show_description)
+            display_as_table(parsed_items, project_info, show_description,
+                             pretty=args.output == 'table-pretty')
     
     except Exception as e:
         print(f"❌ Error: {e}")
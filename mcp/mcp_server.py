@@ -7,12 +7,17 @@ This server exposes the following tools:
 1. get_project_tasks_full - Get all tasks from a project with optional filters
 2. get_child_tasks - Get child tasks of a specific task
 3. get_task_info - Get detailed information about a specific task
+4. create_test_case_task - Create a test case task and add it to a project
 
-All tools support filtering by label, status, and assignee.
+The query tools support filtering by label, status, and assignee.
 """
 
+import atexit
 import json
 import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Dict, List, Any
 from pathlib import Path
 
@@ -23,10 +28,210 @@ try:
 except ImportError:
     DOTENV_AVAILABLE = False
 
-# Import the GitHub project manager from the existing script
+# Optional, serializes the (large) tool results several times faster
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional, compiles each tool's inputSchema to a straight-line validator;
+# without it arguments are passed through unvalidated as before
+try:
+    import fastjsonschema
+    FASTJSONSCHEMA_AVAILABLE = True
+except ImportError:
+    FASTJSONSCHEMA_AVAILABLE = False
+
+# Import the GitHub project manager from the sibling script. The project
+# root is on sys.path only for the duration of this import, so every
+# later import in the process skips the extra path entry.
 import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
-from get_project_tasks import GitHubProjectManager
+_PROJECT_ROOT = str(Path(__file__).resolve().parent.parent)
+sys.path.insert(0, _PROJECT_ROOT)
+try:
+    from get_project_tasks import GitHubProjectManager, _json_default
+finally:
+    if sys.path and sys.path[0] == _PROJECT_ROOT:
+        del sys.path[0]
+
+
+if ORJSON_AVAILABLE:
+    _loads = orjson.loads
+
+    def _dumps(obj, indent: bool = False) -> str:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option, default=_json_default).decode()
+
+    def _dumps_bytes(obj) -> bytes:
+        return orjson.dumps(obj, default=_json_default)
+else:
+    _loads = json.loads
+
+    def _dumps(obj, indent: bool = False) -> str:
+        if indent:
+            return json.dumps(obj, indent=2, default=str)
+        return json.dumps(obj, separators=(',', ':'), default=str)
+
+    def _dumps_bytes(obj) -> bytes:
+        return json.dumps(obj, default=str).encode()
+
+# Exponential backoff delays (seconds) used when GitHub rate-limits a request
+_BACKOFF_DELAYS = (1, 2, 4, 8, 16, 32)
+
+# .env is probed at most once per process; the result is memoized here
+_ENV_LOADED = False
+_ENV_PATH = None
+
+
+def _load_env_once(verbose: bool = False):
+    """Load the first .env found in cwd, script dir, or project root.
+
+    The three-location filesystem probe runs a single time per process;
+    later calls return the memoized path (or None) without re-statting.
+    """
+    global _ENV_LOADED, _ENV_PATH
+    if _ENV_LOADED:
+        return _ENV_PATH
+    _ENV_LOADED = True
+
+    if not DOTENV_AVAILABLE:
+        if verbose:
+            print("⚠️  python-dotenv not available, relying on environment variables", file=sys.stderr)
+        return None
+
+    # Plain os.path strings: each candidate is one isfile() syscall, with
+    # none of the intermediate Path allocations of the pathlib equivalent
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    parent_dir = os.path.dirname(script_dir)
+    if verbose:
+        print("🔍 Searching for .env file...", file=sys.stderr)
+        print(f"   Current working directory: {os.getcwd()}", file=sys.stderr)
+        print(f"   Script directory: {script_dir}", file=sys.stderr)
+        print(f"   Parent directory: {parent_dir}", file=sys.stderr)
+
+    for env_path in (os.path.join(os.getcwd(), '.env'),
+                     os.path.join(script_dir, '.env'),
+                     os.path.join(parent_dir, '.env')):
+        if os.path.isfile(env_path):
+            if verbose:
+                print(f"✅ Loading .env from: {env_path}", file=sys.stderr)
+            load_dotenv(env_path, override=True)
+            _ENV_PATH = env_path
+            return env_path
+        if verbose:
+            print(f"   ❌ Not found: {env_path}", file=sys.stderr)
+    return None
+
+
+# Tool results are compact by default — indentation adds 10-30% to large
+# payloads that the client re-parses anyway. MCP_PRETTY=1 restores the
+# human-readable form for debugging
+_PRETTY = os.environ.get('MCP_PRETTY') == '1'
+
+# How long a fetched item list is reused before re-fetching. Tool calls
+# typically arrive in bursts against the same project (list, then drill
+# into tasks); within this window they share one fetch.
+# MCP_ITEMS_CACHE_TTL (seconds) tunes the window per deployment
+try:
+    ITEMS_CACHE_TTL = float(os.environ.get('MCP_ITEMS_CACHE_TTL', 60.0))
+except ValueError:
+    ITEMS_CACHE_TTL = 60.0
+
+# Largest accepted JSON-RPC batch array; anything bigger is refused
+# outright rather than queued behind one worker
+_MAX_BATCH = 100
+
+# Written to stderr in one call when no GitHub token can be found
+_USAGE_BANNER = f"""{'=' * 80}
+❌ ERROR: GitHub token not found!
+
+To use this MCP server, you need to provide a GitHub token:
+
+Option 1: Create a .env file in the project directory:
+  GITHUB_TOKEN=your_github_token_here
+
+Option 2: Set the GITHUB_TOKEN environment variable:
+  export GITHUB_TOKEN=your_github_token_here
+
+To create a token:
+  1. Go to GitHub Settings → Developer settings → Personal access tokens
+  2. Generate a new token with 'repo' and 'project' scopes
+
+{'=' * 80}"""
+
+# Written to stderr in one call by 'python mcp_server.py test'
+_TEST_MODE_EXAMPLES = """
+🧪 Test Mode - Demonstrating tool usage
+
+Example 1: Get all project tasks
+Tool: get_project_tasks_full
+Arguments: {'org': '4d', 'project_id': 745}
+
+Example 2: Get child tasks of issue #123
+Tool: get_child_tasks
+Arguments: {'org': '4d', 'project_id': 745, 'task_number': 123}
+
+Example 3: Get detailed task information
+Tool: get_task_info
+Arguments: {'org': '4d', 'project_id': 745, 'task_number': 123}
+
+"""
+
+
+def _filter_parsed(parsed_items: List[Dict], filters: Dict) -> List[Dict]:
+    """Apply type/label/status/assignee filters to already-parsed items.
+
+    Same predicates as GitHubProjectManager.filter_items, but against the
+    parsed dict shape, so filtering never round-trips through the raw
+    GraphQL items.
+    """
+    wanted_type = filters.get('type')
+    wanted_label = filters['label'].lower() if filters.get('label') else None
+    wanted_status = filters['status'].lower() if filters.get('status') else None
+    wanted_assignee = filters.get('assignee')
+
+    filtered = []
+    for item in parsed_items:
+        if wanted_type and item.get('type') != wanted_type:
+            continue
+        if wanted_assignee and wanted_assignee not in item.get('assignees', ()):
+            continue
+        if wanted_label and not any(
+            label.lower() == wanted_label for label in item.get('labels', ())
+        ):
+            continue
+        if wanted_status and str(
+            item.get('project_fields', {}).get('Status', '')
+        ).lower() != wanted_status:
+            continue
+        filtered.append(item)
+
+    return filtered
+
+
+def _call_with_backoff(fn, *args, **kwargs):
+    """Call fn, retrying with exponential backoff on 403/429 rate-limit errors.
+
+    Honors the Retry-After header when the server provides one, otherwise
+    backs off 1s, 2s, 4s, ... up to 32s before giving up.
+    """
+    import requests
+
+    for attempt, delay in enumerate(_BACKOFF_DELAYS + (None,)):
+        try:
+            return fn(*args, **kwargs)
+        except requests.exceptions.HTTPError as e:
+            response = e.response
+            if delay is None or response is None or response.status_code not in (403, 429):
+                raise
+            retry_after = response.headers.get('Retry-After')
+            if retry_after:
+                try:
+                    delay = max(delay, int(retry_after))
+                except ValueError:
+                    pass
+            time.sleep(delay)
 
 
 class GitHubProjectMCPServer:
@@ -36,46 +241,219 @@ class GitHubProjectMCPServer:
         """Initialize the MCP server."""
         self.manager = None
         self.token = None
-        
-    def initialize(self, token: str = None):
-        """Initialize the GitHub manager with a token."""
-        # If no token provided and dotenv is available, try to load .env file
-        if not token and DOTENV_AVAILABLE:
-            # Look for .env file in the current directory and parent directories
-            env_path = Path.cwd() / '.env'
-            if env_path.exists():
-                load_dotenv(env_path, override=True)
+        # Metadata caches - these IDs are stable for the lifetime of the
+        # process, so each is resolved at most once per session
+        self._project_cache: Dict[tuple, Dict] = {}
+        self._repo_id_cache: Dict[tuple, str] = {}
+        self._user_id_cache: Dict[str, str] = {}
+        # Item lists expire after ITEMS_CACHE_TTL: (org, project_id,
+        # type_hint) -> (expiry, project_info, items, parsed, id_index,
+        # number_index)
+        self._items_cache: Dict[tuple, tuple] = {}
+        # Parsed items by item id, reused across refetches for items whose
+        # updatedAt stamps have not moved (see _parse_items)
+        self._parsed_cache: Dict[str, tuple] = {}
+        # In-flight fetches by cache key; concurrent callers for the same
+        # project share one upstream fetch instead of issuing their own
+        self._inflight: Dict[tuple, Future] = {}
+        self._fetch_lock = threading.Lock()
+        # Tool name -> compiled inputSchema validator (filled by
+        # create_mcp_server when fastjsonschema is installed)
+        self._validators: Dict[str, Any] = {}
+        # Tool name -> bound method, used by handle_tool_call dispatch
+        self._handlers = {
+            'get_project_tasks_full': self.get_project_tasks_full,
+            'get_child_tasks': self.get_child_tasks,
+            'get_task_info': self.get_task_info,
+            'create_test_case_task': self.create_test_case_task,
+        }
+
+    def _parse_items(self, items: List[Dict]) -> List[Dict]:
+        """Parse raw items, reusing parsed dicts for unchanged items.
+
+        parse_item_data rebuilds a dict tree per item, which dominates the
+        post-fetch cost on large projects. Entries are keyed by item id and
+        validated against the item- and content-level updatedAt stamps, so
+        a TTL refetch only re-parses items that actually changed. The cache
+        is rebuilt from the fetch it serves, so removed items never linger.
+        """
+        cache = self._parsed_cache
+        fresh = {}
+        parsed = []
+        parse = self.manager.parse_item_data
+        for item in items:
+            content = item.get('content') or {}
+            version = (item.get('updatedAt'), content.get('updatedAt'))
+            entry = cache.get(item['id'])
+            if entry is None or entry[0] != version:
+                entry = (version, parse(item))
+            fresh[item['id']] = entry
+            parsed.append(entry[1])
+        self._parsed_cache = fresh
+        return parsed
+
+    def _get_project_info(self, org: str, project_id: int) -> Dict:
+        """Get project info, cached per (org, project_id)."""
+        key = (org, project_id)
+        if key not in self._project_cache:
+            self._project_cache[key] = self.manager.get_project_by_number(org, project_id)
+        return self._project_cache[key]
+
+    def _get_project_and_items(self, org: str, project_id: int,
+                               type_hint: str = None) -> tuple:
+        """Return (project_info, items, parsed, id_index, number_index).
+
+        Every query tool needs the project plus its full item list; caching
+        them together turns the second and later calls within the TTL into
+        dict lookups instead of O(pages) GraphQL round-trips. Items are
+        parsed once per fetch and the parsed list (parallel to items) is
+        cached alongside, with hash indexes over the parsed items by item
+        id and issue number, so tool calls never re-run parse_item_data or
+        scan the list for a single task.
+
+        Concurrent calls for the same key are coalesced: the first caller
+        fetches while the rest wait on its Future and share the result, so
+        N simultaneous tool calls cost one upstream fetch.
+        """
+        key = (org, project_id, type_hint)
+        with self._fetch_lock:
+            cached = self._items_cache.get(key)
+            if cached and cached[0] > time.monotonic():
+                return cached[1:]
+            if type_hint:
+                # A fresh unhinted fetch is a superset of any hinted one;
+                # callers filter by type afterwards, so serve it rather
+                # than paying a second pagination for the narrower shape
+                full = self._items_cache.get((org, project_id, None))
+                if full and full[0] > time.monotonic():
+                    return full[1:]
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                inflight = self._inflight[key] = Future()
+                fetching = True
             else:
-                # Try script directory
-                script_dir = Path(__file__).parent
-                env_path = script_dir / '.env'
-                if env_path.exists():
-                    load_dotenv(env_path, override=True)
+                fetching = False
+
+        if not fetching:
+            # Another caller owns the fetch; block until it completes
+            return inflight.result()
+
+        try:
+            project_info = self._get_project_info(org, project_id)
+            items = self.manager.get_all_project_items(
+                project_info['id'],
+                include_body=True, include_sub_issues=True, include_parent=True,
+                type_hint=type_hint
+            )
+            parsed = self._parse_items(items)
+            id_index = {p['id']: p for p in parsed}
+            number_index = {p['number']: p for p in parsed if p.get('number')}
+            entry = (project_info, items, parsed, id_index, number_index)
+        except BaseException as e:
+            with self._fetch_lock:
+                del self._inflight[key]
+            inflight.set_exception(e)
+            raise
+
+        with self._fetch_lock:
+            self._items_cache[key] = (time.monotonic() + ITEMS_CACHE_TTL,) + entry
+            del self._inflight[key]
+        inflight.set_result(entry)
+        return entry
+
+    def invalidate(self, org: str, project_id: int) -> None:
+        """Drop cached item lists for a project (e.g. after creating tasks)."""
+        for key in [k for k in self._items_cache if k[:2] == (org, project_id)]:
+            del self._items_cache[key]
+
+    def _get_repository_id(self, owner: str, repo: str) -> str:
+        """Get a repository node ID, cached per (owner, repo)."""
+        key = (owner, repo)
+        if key not in self._repo_id_cache:
+            self._repo_id_cache[key] = self.manager.get_repository_id(owner, repo)
+        return self._repo_id_cache[key]
+
+    def _get_user_id(self, username: str) -> str:
+        """Get a user node ID, cached per username."""
+        if username not in self._user_id_cache:
+            self._user_id_cache[username] = self.manager.get_user_id(username)
+        return self._user_id_cache[username]
+
+    def prefetch_task_metadata(self, org: str, tasks: List[Dict]) -> None:
+        """Resolve every repository and assignee referenced by tasks in one query.
+
+        Collects the union of repositories and assignees across the task list
+        and fetches all their node IDs with a single aliased GraphQL query, so
+        the per-task creation path runs entirely from the caches.
+        """
+        if not self.manager:
+            self.initialize()
+
+        repos = []
+        users = []
+        for arguments in tasks:
+            repository = arguments.get('repository')
+            if repository:
+                if '/' in repository:
+                    owner, repo = repository.split('/', 1)
                 else:
-                    # Try parent directory of script (project root)
-                    env_path = script_dir.parent / '.env'
-                    if env_path.exists():
-                        load_dotenv(env_path, override=True)
-        
-        self.token = token or os.getenv('GITHUB_TOKEN')
-        if not self.token:
+                    owner, repo = org, repository
+                if (owner, repo) not in self._repo_id_cache and (owner, repo) not in repos:
+                    repos.append((owner, repo))
+            for username in arguments.get('assignees') or []:
+                if username not in self._user_id_cache and username not in users:
+                    users.append(username)
+
+        if not repos and not users:
+            return
+
+        fields = []
+        for i, (owner, repo) in enumerate(repos):
+            fields.append(f'r{i}: repository(owner: {json.dumps(owner)}, name: {json.dumps(repo)}) {{ id }}')
+        for i, username in enumerate(users):
+            fields.append(f'u{i}: user(login: {json.dumps(username)}) {{ id }}')
+
+        query = 'query PrefetchTaskMetadata {\n' + '\n'.join(fields) + '\n}'
+        result = self.manager.execute_graphql_query(query)
+
+        for i, (owner, repo) in enumerate(repos):
+            node = result.get(f'r{i}')
+            if node:
+                self._repo_id_cache[(owner, repo)] = node['id']
+        for i, username in enumerate(users):
+            node = result.get(f'u{i}')
+            if node:
+                self._user_id_cache[username] = node['id']
+
+    def initialize(self, token: str = None):
+        """Initialize the GitHub manager with a token.
+
+        Idempotent for an unchanged token: the existing manager (and its
+        warm keep-alive connection pools) is kept rather than replaced.
+        """
+        # If no token provided, try the (memoized) .env lookup
+        if not token:
+            _load_env_once()
+
+        # GITHUB_TOKENS (comma-separated) lets large runs rotate across
+        # several PATs; a single GITHUB_TOKEN keeps working unchanged
+        token = token or os.environ.get('GITHUB_TOKENS') or os.environ.get('GITHUB_TOKEN')
+        if not token:
             raise ValueError("GitHub token is required. Set GITHUB_TOKEN environment variable or pass it explicitly.")
-        self.manager = GitHubProjectManager(self.token)
-    
-    def _filter_items(self, items: List[Dict], label: str = None, status: str = None, assignee: str = None) -> List[Dict]:
-        """Apply filters to a list of items."""
-        filters = {}
-        if label:
-            filters['label'] = label
-        if status:
-            filters['status'] = status
-        if assignee:
-            filters['assignee'] = assignee
-        
-        if filters:
-            return self.manager.filter_items(items, filters)
-        return items
-    
+        if self.manager is not None and token == self.token:
+            return
+        if self.manager is not None:
+            self.manager.close()
+        else:
+            atexit.register(self._close_manager)
+        self.token = token
+        self.manager = GitHubProjectManager(token)
+
+    def _close_manager(self):
+        """atexit hook: release the manager's sessions and cache handle."""
+        if self.manager is not None:
+            self.manager.close()
+
     def get_project_tasks_full(
         self,
         org: str = None,
@@ -110,28 +488,16 @@ class GitHubProjectMCPServer:
         if not project_id:
             raise ValueError("project_id is required.")
         
-        # Get project information
-        project_info = self.manager.get_project_by_number(org, project_id)
-        
-        # Get all project items
-        items = self.manager.get_all_project_items(project_info['id'])
-        
-        # Apply type filter if specified
-        filters = {}
-        if item_type:
-            filters['type'] = item_type
-        if label:
-            filters['label'] = label
-        if status:
-            filters['status'] = status
-        if assignee:
-            filters['assignee'] = assignee
-        
-        if filters:
-            items = self.manager.filter_items(items, filters)
-        
-        # Parse items
-        parsed_items = [self.manager.parse_item_data(item) for item in items]
+        # Get the project and its items (cached); a single requested type
+        # lets the query drop the other content fragments entirely — the
+        # only filter ProjectV2 GraphQL can push server-side (the items
+        # connection has no filterBy, so label/status/assignee stay local)
+        project_info, _, parsed, _, _ = self._get_project_and_items(
+            org, project_id, type_hint=item_type)
+
+        filters = {k: v for k, v in (('type', item_type), ('label', label),
+                                     ('status', status), ('assignee', assignee)) if v}
+        parsed_items = _filter_parsed(parsed, filters) if filters else parsed
         
         return {
             'project': {
@@ -186,52 +552,35 @@ class GitHubProjectMCPServer:
         
         if not task_id and not task_number:
             raise ValueError("Either task_id or task_number must be provided")
-        
-        # Get project information
-        project_info = self.manager.get_project_by_number(org, project_id)
-        
-        # Get all project items
-        items = self.manager.get_all_project_items(project_info['id'])
-        
-        # Parse all items
-        parsed_items = [self.manager.parse_item_data(item) for item in items]
-        
-        # Find the parent task
-        parent_task = None
+
+        # Get the project and its items, parsed and indexed once (cached)
+        project_info, _, _, id_index, number_index = \
+            self._get_project_and_items(org, project_id)
+
+        # Find the parent task: O(1) index lookups instead of list scans
         if task_number:
-            parent_task = next((item for item in parsed_items if item.get('number') == task_number), None)
-        elif task_id:
-            parent_task = next((item for item in parsed_items if item['id'] == task_id), None)
-        
+            parent_task = number_index.get(task_number)
+        else:
+            parent_task = id_index.get(task_id)
+
         if not parent_task:
             raise ValueError(f"Task not found in project (task_id={task_id}, task_number={task_number})")
-        
-        # Get child tasks from sub_issues
-        child_tasks = []
-        if parent_task.get('sub_issues'):
-            # Create a mapping of issue numbers to parsed items
-            number_to_item = {item['number']: item for item in parsed_items if item.get('number')}
-            
-            for sub_issue in parent_task['sub_issues']:
-                sub_number = sub_issue.get('number')
-                if sub_number and sub_number in number_to_item:
-                    child_task = number_to_item[sub_number]
-                    child_tasks.append(child_task)
+
+        # Get child tasks from sub_issues via the shared number index; the
+        # bound .get avoids an attribute lookup per sub-issue
+        index_get = number_index.get
+        child_tasks = [
+            task
+            for task in (index_get(s.get('number')) for s in parent_task.get('sub_issues') or ())
+            if task is not None
+        ]
         
         # Apply filters to child tasks
-        filters = {}
-        if label:
-            filters['label'] = label
-        if status:
-            filters['status'] = status
-        if assignee:
-            filters['assignee'] = assignee
-        
+        filters = {k: v for k, v in (('label', label), ('status', status),
+                                     ('assignee', assignee)) if v}
         if filters:
-            # We need to convert back to the raw format for filtering, then parse again
-            raw_items = [item for item in items if self.manager.parse_item_data(item)['id'] in [ct['id'] for ct in child_tasks]]
-            filtered_raw = self.manager.filter_items(raw_items, filters)
-            child_tasks = [self.manager.parse_item_data(item) for item in filtered_raw]
+            # One pass over the (small) child set, on the parsed shape
+            child_tasks = _filter_parsed(child_tasks, filters)
         
         return {
             'parent_task': parent_task,
@@ -272,26 +621,33 @@ class GitHubProjectMCPServer:
         
         if not task_id and not task_number:
             raise ValueError("Either task_id or task_number must be provided")
-        
-        # Get project information
-        project_info = self.manager.get_project_by_number(org, project_id)
-        
-        # Get all project items
-        items = self.manager.get_all_project_items(project_info['id'])
-        
-        # Parse all items
-        parsed_items = [self.manager.parse_item_data(item) for item in items]
-        
-        # Find the task
-        task = None
-        if task_number:
-            task = next((item for item in parsed_items if item.get('number') == task_number), None)
-        elif task_id:
-            task = next((item for item in parsed_items if item['id'] == task_id), None)
-        
+
+        # A lookup by item id resolves with a single-node query, so when no
+        # warm item list exists there is no reason to page the whole
+        # project for one task. Number lookups have no such shortcut (the
+        # items connection is only addressable by cursor), and a warm cache
+        # answers both shapes without any network at all.
+        if task_id and not task_number:
+            with self._fetch_lock:
+                cached = self._items_cache.get((org, project_id, None))
+                warm = cached is not None and cached[0] > time.monotonic()
+            if not warm:
+                project_info = self._get_project_info(org, project_id)
+                raw_item = self.manager.get_single_project_item(task_id)
+                task = self.manager.parse_item_data(raw_item) if raw_item else None
+            else:
+                task = cached[4].get(task_id)
+                project_info = cached[1]
+        else:
+            # Get the project and its items, parsed and indexed once
+            # (cached); the task resolves through the O(1) number index
+            project_info, _, _, id_index, number_index = \
+                self._get_project_and_items(org, project_id)
+            task = number_index.get(task_number) if task_number else id_index.get(task_id)
+
         if not task:
             raise ValueError(f"Task not found in project (task_id={task_id}, task_number={task_number})")
-        
+
         return {
             'project': {
                 'id': project_info['id'],
@@ -301,145 +657,524 @@ class GitHubProjectMCPServer:
             'task': task
         }
 
+    def create_test_case_task(
+        self,
+        org: str = None,
+        project_id: int = None,
+        repository: str = None,
+        title: str = None,
+        body: str = '',
+        parent_task_number: int = None,
+        labels: List[str] = None,
+        assignees: List[str] = None,
+        custom_fields: Dict[str, str] = None
+    ) -> Dict[str, Any]:
+        """
+        Create a single test case task (issue) and add it to a project.
+
+        Args:
+            org: GitHub organization name (uses GITHUB_ORG env var if not provided)
+            project_id: GitHub project number
+            repository: Repository name in 'owner/name' format (defaults to org/repo lookup)
+            title: Issue title (required)
+            body: Issue body/description (optional)
+            parent_task_number: Issue number of the parent task to link as sub-issue (optional)
+            labels: List of label names to apply (optional)
+            assignees: List of assignee usernames (optional)
+            custom_fields: Mapping of project field name to value (optional)
 
-def create_mcp_server():
-    """Create and configure the MCP server with tool definitions."""
-    
-    server = GitHubProjectMCPServer()
-    
-    # MCP Server metadata
-    server_info = {
-        "name": "github-project-tasks",
-        "version": "1.0.0",
-        "description": "MCP server for querying GitHub Projects with filtering capabilities"
-    }
-    
-    # Tool definitions following MCP specification
-    tools = [
-        {
-            "name": "get_project_tasks_full",
-            "description": "Get all tasks from a GitHub project. Supports filtering by label, status, assignee, and item type. Returns complete list of tasks with all their metadata including assignees, labels, status, parent/child relationships, and custom project fields.",
-            "inputSchema": {
-                "type": "object",
-                "properties": {
-                    "org": {
-                        "type": "string",
-                        "description": "GitHub organization name (e.g., '4d'). If not provided, uses GITHUB_ORG environment variable."
-                    },
-                    "project_id": {
-                        "type": "integer",
-                        "description": "GitHub project number (e.g., 745 from the project URL)"
-                    },
-                    "label": {
-                        "type": "string",
-                        "description": "Filter tasks by label name (case-insensitive, optional)"
-                    },
-                    "status": {
-                        "type": "string",
-                        "description": "Filter tasks by status field value like 'In Progress', 'Done', etc. (case-insensitive, optional)"
-                    },
-                    "assignee": {
-                        "type": "string",
-                        "description": "Filter tasks by assignee username (optional)"
-                    },
-                    "item_type": {
-                        "type": "string",
-                        "enum": ["issue", "pull_request", "draft_issue"],
-                        "description": "Filter by item type (optional)"
+        Returns:
+            Dictionary containing the created issue's number, URL, and project item ID
+        """
+        if not self.manager:
+            self.initialize()
+
+        org = org or os.getenv('GITHUB_ORG')
+        if not org:
+            raise ValueError("GitHub organization is required. Provide 'org' parameter or set GITHUB_ORG environment variable.")
+
+        if not project_id:
+            raise ValueError("project_id is required.")
+
+        if not title:
+            raise ValueError("title is required.")
+
+        if not repository:
+            raise ValueError("repository is required (format: 'owner/name' or 'name' within the org).")
+
+        if '/' in repository:
+            owner, repo = repository.split('/', 1)
+        else:
+            owner, repo = org, repository
+
+        # Get project information (cached across calls)
+        project_info = self._get_project_info(org, project_id)
+
+        # Resolve every ID the creation needs in a single aliased query,
+        # reusing cached entries where the prefetch already warmed them
+        missing_users = [a for a in (assignees or []) if a not in self._user_id_cache]
+        field_ids = {}
+        if (owner, repo) not in self._repo_id_cache or missing_users or labels or custom_fields:
+            resolved = self.manager.resolve_ids(
+                owner, repo,
+                usernames=missing_users or None,
+                label_names=labels,
+                field_names=list(custom_fields) if custom_fields else None,
+                project_id=project_info['id'] if custom_fields else None
+            )
+            self._repo_id_cache[(owner, repo)] = resolved['repository_id']
+            self._user_id_cache.update(resolved.get('user_ids', {}))
+            field_ids = resolved.get('field_ids', {})
+            label_ids = resolved.get('label_ids') or None
+        else:
+            label_ids = None
+
+        repository_id = self._repo_id_cache[(owner, repo)]
+        assignee_ids = [self._user_id_cache[a] for a in assignees] if assignees else None
+
+        # Create the issue
+        issue = self.manager.create_issue(repository_id, title, body, label_ids, assignee_ids)
+
+        # Find the parent task if requested (cached items); addSubIssue
+        # takes the Issue content node id, not the project item id
+        parent_issue_id = None
+        if parent_task_number:
+            number_index = self._get_project_and_items(org, project_id)[4]
+            parent_task = number_index.get(parent_task_number)
+            if not parent_task:
+                raise ValueError(f"Parent task #{parent_task_number} not found in project")
+            parent_issue_id = parent_task.get('content_id')
+            if not parent_issue_id:
+                raise ValueError(f"Parent task #{parent_task_number} is not an issue that can have sub-issues")
+
+        # Add the issue to the project and link the parent in one round-trip
+        item_id = self.manager.add_to_project_and_link(project_info['id'], issue['id'], parent_issue_id)
+
+        # The cached item list no longer reflects the project
+        self.invalidate(org, project_id)
+
+        # Set custom project field values — all in one aliased mutation
+        if custom_fields:
+            self.manager.update_project_fields_bulk(project_info['id'], item_id, {
+                field_ids[name]: value
+                for name, value in custom_fields.items() if name in field_ids
+            })
+
+        return {
+            'status': 'success',
+            'issue_number': issue.get('number'),
+            'issue_url': issue.get('url'),
+            'issue_id': issue.get('id'),
+            'project_item_id': item_id
+        }
+
+    def create_test_case_tasks_batch(
+        self,
+        org: str = None,
+        project_id: int = None,
+        tasks: List[Dict[str, Any]] = None,
+        batch_size: int = 20
+    ) -> List[Dict[str, Any]]:
+        """
+        Create several test case tasks using batched GraphQL mutations.
+
+        Instead of one round-trip per task, tasks are grouped into chunks of
+        batch_size: each chunk is created with a single aliased createIssue
+        mutation, added to the project with a second one, and the chunk's
+        parent links (addSubIssue) and custom field values
+        (updateProjectV2ItemFieldValue) each travel as a third and fourth
+        aliased mutation when any task carries them. A parent_task_number may
+        reference an existing project task or one created earlier in this call.
+
+        Args:
+            org: GitHub organization name (uses GITHUB_ORG env var if not provided)
+            project_id: GitHub project number
+            tasks: List of task argument dicts (same keys as create_test_case_task)
+            batch_size: Number of tasks per GraphQL mutation document (default 20)
+
+        Returns:
+            List of result dictionaries, one per task, in input order
+        """
+        if not self.manager:
+            self.initialize()
+
+        org = org or os.getenv('GITHUB_ORG')
+        if not org:
+            raise ValueError("GitHub organization is required. Provide 'org' parameter or set GITHUB_ORG environment variable.")
+
+        if not project_id:
+            raise ValueError("project_id is required.")
+
+        if not tasks:
+            return []
+
+        # Get project information once for the whole batch (cached across calls)
+        project_info = self._get_project_info(org, project_id)
+
+        # Parent references resolve against the project's number index,
+        # fetched once before anything is created (parents that pre-exist),
+        # plus the issues created earlier in this call (parents by position)
+        number_index = {}
+        if any(arguments.get('parent_task_number') for arguments in tasks):
+            number_index = self._get_project_and_items(org, project_id)[4]
+        created_issue_ids: Dict[int, str] = {}
+
+        results = []
+        for start in range(0, len(tasks), batch_size):
+            chunk = tasks[start:start + batch_size]
+
+            # Build the CreateIssueInput for each task in the chunk; tasks
+            # whose parent cannot be resolved fail here, before any issue
+            # is created for them
+            issue_inputs = []
+            chunk_errors = {}
+            parent_ids = {}
+            for i, arguments in enumerate(chunk):
+                try:
+                    repository = arguments.get('repository')
+                    if not repository:
+                        raise ValueError("repository is required")
+                    if '/' in repository:
+                        owner, repo = repository.split('/', 1)
+                    else:
+                        owner, repo = org, repository
+
+                    parent_number = arguments.get('parent_task_number')
+                    if parent_number:
+                        # Both sources hold Issue content node ids — what
+                        # addSubIssue takes — never project item ids
+                        parent_id = created_issue_ids.get(parent_number)
+                        if not parent_id:
+                            parent_task = number_index.get(parent_number)
+                            if not parent_task:
+                                raise ValueError(f"Parent task #{parent_number} not found in project")
+                            parent_id = parent_task.get('content_id')
+                            if not parent_id:
+                                raise ValueError(f"Parent task #{parent_number} is not an issue that can have sub-issues")
+                        parent_ids[i] = parent_id
+
+                    issue_input = {
+                        'repositoryId': self._get_repository_id(owner, repo),
+                        'title': arguments.get('title', 'Untitled'),
+                        'body': arguments.get('body', '')
                     }
+                    labels = arguments.get('labels')
+                    if labels:
+                        label_ids = self.manager.get_label_ids(owner, repo, labels)
+                        if label_ids:
+                            issue_input['labelIds'] = label_ids
+                    assignees = arguments.get('assignees')
+                    if assignees:
+                        issue_input['assigneeIds'] = [self._get_user_id(a) for a in assignees]
+
+                    issue_inputs.append(issue_input)
+                except Exception as e:
+                    chunk_errors[i] = str(e)
+                    issue_inputs.append(None)
+
+            # One round-trip creates every issue in the chunk
+            valid_inputs = [inp for inp in issue_inputs if inp is not None]
+            try:
+                created = _call_with_backoff(self.manager.create_issues_batch, valid_inputs)
+            except Exception as e:
+                for arguments in chunk:
+                    results.append({
+                        'status': 'error',
+                        'title': arguments.get('title', 'Untitled'),
+                        'error': str(e)
+                    })
+                continue
+
+            # Merge created issues back into chunk order
+            created_iter = iter(created)
+            chunk_issues = [None if inp is None else next(created_iter) for inp in issue_inputs]
+
+            # A second round-trip adds the whole chunk to the project
+            issue_ids = [issue['id'] for issue in chunk_issues if issue]
+            item_ids = _call_with_backoff(self.manager.add_issues_to_project_batch,
+                                          project_info['id'], issue_ids)
+            item_id_by_issue = dict(zip(issue_ids, item_ids))
+
+            # Issues created in this chunk become eligible parents for later chunks
+            for issue in chunk_issues:
+                if issue and issue.get('number'):
+                    created_issue_ids[issue['number']] = issue['id']
+
+            # Third and fourth round-trips: the chunk's parent links and its
+            # custom field values, each as one aliased mutation
+            link_pairs = []
+            field_updates = []
+            for i, (arguments, issue) in enumerate(zip(chunk, chunk_issues)):
+                if issue is None:
+                    continue
+                if i in parent_ids:
+                    link_pairs.append((parent_ids[i], issue['id']))
+                custom_fields = arguments.get('custom_fields')
+                if custom_fields:
+                    item_id = item_id_by_issue.get(issue['id'])
+                    for name, value in custom_fields.items():
+                        field_id = self.manager.get_field_id_by_name(project_info['id'], name)
+                        if field_id:
+                            field_updates.append((item_id, field_id, value))
+
+            # A failure here must not lose the chunk's created issues: the
+            # affected tasks are reported as errors that still carry them
+            link_error = field_error = None
+            if link_pairs:
+                try:
+                    _call_with_backoff(self.manager.link_sub_issues_batch, link_pairs)
+                except Exception as e:
+                    link_error = str(e)
+            if field_updates:
+                try:
+                    _call_with_backoff(self.manager.update_project_fields_batch,
+                                       project_info['id'], field_updates)
+                except Exception as e:
+                    field_error = str(e)
+
+            for i, (arguments, issue) in enumerate(zip(chunk, chunk_issues)):
+                if issue is None:
+                    results.append({
+                        'status': 'error',
+                        'title': arguments.get('title', 'Untitled'),
+                        'error': chunk_errors.get(i, 'unknown error')
+                    })
+                    continue
+
+                error = None
+                if link_error and i in parent_ids:
+                    error = f"issue created but parent link failed: {link_error}"
+                elif field_error and arguments.get('custom_fields'):
+                    error = f"issue created but field update failed: {field_error}"
+
+                result = {
+                    'status': 'error' if error else 'success',
+                    'title': arguments.get('title', 'Untitled'),
+                    'issue_number': issue.get('number'),
+                    'issue_url': issue.get('url'),
+                    'issue_id': issue.get('id'),
+                    'project_item_id': item_id_by_issue.get(issue['id'])
+                }
+                if error:
+                    result['error'] = error
+                results.append(result)
+
+        # The cached item list no longer reflects the project
+        self.invalidate(org, project_id)
+        return results
+
+
+# MCP Server metadata
+SERVER_INFO = {
+    "name": "github-project-tasks",
+    "version": "1.0.0",
+    "description": "MCP server for querying GitHub Projects with filtering capabilities"
+}
+
+# Tool definitions following MCP specification; module-level so server
+# re-creation (host reconnects, tests) shares them by reference instead
+# of rebuilding the nested schema dicts
+TOOLS = [
+    {
+        "name": "get_project_tasks_full",
+        "description": "Get all tasks from a GitHub project. Supports filtering by label, status, assignee, and item type. Returns complete list of tasks with all their metadata including assignees, labels, status, parent/child relationships, and custom project fields.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "org": {
+                    "type": "string",
+                    "description": "GitHub organization name (e.g., '4d'). If not provided, uses GITHUB_ORG environment variable."
                 },
-                "required": ["project_id"]
-            }
-        },
-        {
-            "name": "get_child_tasks",
-            "description": "Get all child tasks (sub-issues) of a specific parent task. Supports filtering child tasks by label, status, and assignee. Useful for exploring task hierarchies and dependencies.",
-            "inputSchema": {
-                "type": "object",
-                "properties": {
-                    "org": {
-                        "type": "string",
-                        "description": "GitHub organization name (e.g., '4d'). If not provided, uses GITHUB_ORG environment variable."
-                    },
-                    "project_id": {
-                        "type": "integer",
-                        "description": "GitHub project number (e.g., 745 from the project URL)"
-                    },
-                    "task_id": {
-                        "type": "string",
-                        "description": "GitHub task/issue ID (optional, either this or task_number is required)"
-                    },
-                    "task_number": {
-                        "type": "integer",
-                        "description": "GitHub issue number like #123 (optional, either this or task_id is required)"
-                    },
-                    "label": {
-                        "type": "string",
-                        "description": "Filter child tasks by label name (case-insensitive, optional)"
-                    },
-                    "status": {
-                        "type": "string",
-                        "description": "Filter child tasks by status field value (case-insensitive, optional)"
-                    },
-                    "assignee": {
-                        "type": "string",
-                        "description": "Filter child tasks by assignee username (optional)"
-                    }
+                "project_id": {
+                    "type": "integer",
+                    "description": "GitHub project number (e.g., 745 from the project URL)"
                 },
-                "required": ["project_id"]
-            }
-        },
-        {
-            "name": "get_task_info",
-            "description": "Get detailed information about a specific task including title, description, state, assignees, labels, parent task, sub-issues, project fields, URLs, and timestamps. Use this to get complete context about a single task.",
-            "inputSchema": {
-                "type": "object",
-                "properties": {
-                    "org": {
-                        "type": "string",
-                        "description": "GitHub organization name (e.g., '4d'). If not provided, uses GITHUB_ORG environment variable."
-                    },
-                    "project_id": {
-                        "type": "integer",
-                        "description": "GitHub project number (e.g., 745 from the project URL)"
-                    },
-                    "task_id": {
-                        "type": "string",
-                        "description": "GitHub task/issue ID (optional, either this or task_number is required)"
-                    },
-                    "task_number": {
-                        "type": "integer",
-                        "description": "GitHub issue number like #123 (optional, either this or task_id is required)"
-                    }
+                "label": {
+                    "type": "string",
+                    "description": "Filter tasks by label name (case-insensitive, optional)"
                 },
-                "required": ["project_id"]
-            }
+                "status": {
+                    "type": "string",
+                    "description": "Filter tasks by status field value like 'In Progress', 'Done', etc. (case-insensitive, optional)"
+                },
+                "assignee": {
+                    "type": "string",
+                    "description": "Filter tasks by assignee username (optional)"
+                },
+                "item_type": {
+                    "type": "string",
+                    "enum": ["issue", "pull_request", "draft_issue"],
+                    "description": "Filter by item type (optional)"
+                }
+            },
+            "required": ["project_id"]
         }
-    ]
-    
-    return server, server_info, tools
+    },
+    {
+        "name": "get_child_tasks",
+        "description": "Get all child tasks (sub-issues) of a specific parent task. Supports filtering child tasks by label, status, and assignee. Useful for exploring task hierarchies and dependencies.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "org": {
+                    "type": "string",
+                    "description": "GitHub organization name (e.g., '4d'). If not provided, uses GITHUB_ORG environment variable."
+                },
+                "project_id": {
+                    "type": "integer",
+                    "description": "GitHub project number (e.g., 745 from the project URL)"
+                },
+                "task_id": {
+                    "type": "string",
+                    "description": "GitHub task/issue ID (optional, either this or task_number is required)"
+                },
+                "task_number": {
+                    "type": "integer",
+                    "description": "GitHub issue number like #123 (optional, either this or task_id is required)"
+                },
+                "label": {
+                    "type": "string",
+                    "description": "Filter child tasks by label name (case-insensitive, optional)"
+                },
+                "status": {
+                    "type": "string",
+                    "description": "Filter child tasks by status field value (case-insensitive, optional)"
+                },
+                "assignee": {
+                    "type": "string",
+                    "description": "Filter child tasks by assignee username (optional)"
+                }
+            },
+            "required": ["project_id"]
+        }
+    },
+    {
+        "name": "get_task_info",
+        "description": "Get detailed information about a specific task including title, description, state, assignees, labels, parent task, sub-issues, project fields, URLs, and timestamps. Use this to get complete context about a single task.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "org": {
+                    "type": "string",
+                    "description": "GitHub organization name (e.g., '4d'). If not provided, uses GITHUB_ORG environment variable."
+                },
+                "project_id": {
+                    "type": "integer",
+                    "description": "GitHub project number (e.g., 745 from the project URL)"
+                },
+                "task_id": {
+                    "type": "string",
+                    "description": "GitHub task/issue ID (optional, either this or task_number is required)"
+                },
+                "task_number": {
+                    "type": "integer",
+                    "description": "GitHub issue number like #123 (optional, either this or task_id is required)"
+                }
+            },
+            "required": ["project_id"]
+        }
+    },
+    {
+        "name": "create_test_case_task",
+        "description": "Create a test case task (issue) in a repository and add it to a GitHub project. Supports labels, assignees, linking to a parent task as sub-issue, and setting custom project field values.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "org": {
+                    "type": "string",
+                    "description": "GitHub organization name (e.g., '4d'). If not provided, uses GITHUB_ORG environment variable."
+                },
+                "project_id": {
+                    "type": "integer",
+                    "description": "GitHub project number (e.g., 745 from the project URL)"
+                },
+                "repository": {
+                    "type": "string",
+                    "description": "Repository to create the issue in ('owner/name', or 'name' within the org)"
+                },
+                "title": {
+                    "type": "string",
+                    "description": "Issue title"
+                },
+                "body": {
+                    "type": "string",
+                    "description": "Issue body/description (optional)"
+                },
+                "parent_task_number": {
+                    "type": "integer",
+                    "description": "Issue number of the parent task to link as sub-issue (optional)"
+                },
+                "labels": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Label names to apply to the issue (optional)"
+                },
+                "assignees": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Usernames to assign to the issue (optional)"
+                },
+                "custom_fields": {
+                    "type": "object",
+                    "description": "Mapping of project field name to value (optional)"
+                }
+            },
+            "required": ["project_id", "repository", "title"]
+        }
+    }
+]
+
+# Compile each tool's schema once per process; validation is then a plain call
+if FASTJSONSCHEMA_AVAILABLE:
+    _VALIDATORS = {
+        tool['name']: fastjsonschema.compile(tool['inputSchema'])
+        for tool in TOOLS
+    }
+else:
+    _VALIDATORS = {}
+
+
+def create_mcp_server():
+    """Create and configure the MCP server with tool definitions."""
+
+    server = GitHubProjectMCPServer()
+    server._validators = _VALIDATORS
+
+    return server, SERVER_INFO, TOOLS
 
 
 def handle_tool_call(server: GitHubProjectMCPServer, tool_name: str, arguments: Dict) -> Dict:
     """Handle a tool call and return the result."""
     try:
-        if tool_name == "get_project_tasks_full":
-            result = server.get_project_tasks_full(**arguments)
-        elif tool_name == "get_child_tasks":
-            result = server.get_child_tasks(**arguments)
-        elif tool_name == "get_task_info":
-            result = server.get_task_info(**arguments)
-        else:
+        handler = server._handlers.get(tool_name)
+        if handler is None:
             return {
                 "error": f"Unknown tool: {tool_name}",
                 "isError": True
             }
-        
+
+        validator = server._validators.get(tool_name)
+        if validator is not None:
+            try:
+                validator(arguments)
+            except fastjsonschema.JsonSchemaException as e:
+                return {
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": f"Error: invalid arguments for {tool_name}: {e}"
+                        }
+                    ],
+                    "isError": True
+                }
+
+        result = handler(**arguments)
+
         return {
             "content": [
                 {
                     "type": "text",
-                    "text": json.dumps(result, indent=2, default=str)
+                    "text": _dumps(result, indent=_PRETTY)
                 }
             ]
         }
@@ -459,190 +1194,280 @@ def main():
     """Main entry point for the MCP server using stdio transport."""
     import sys
     
-    # Check for GitHub token before starting the server
-    # Try to load .env file if dotenv is available
-    env_loaded = False
-    env_path = None
-    if DOTENV_AVAILABLE:
-        # Debug: print search paths
-        print(f"🔍 Searching for .env file...", file=sys.stderr)
-        print(f"   Current working directory: {Path.cwd()}", file=sys.stderr)
-        print(f"   Script directory: {Path(__file__).parent}", file=sys.stderr)
-        print(f"   Parent directory: {Path(__file__).parent.parent}", file=sys.stderr)
-        
-        env_path = Path.cwd() / '.env'
-        if env_path.exists():
-            print(f"✅ Loading .env from: {env_path}", file=sys.stderr)
-            load_dotenv(env_path, override=True)
-            env_loaded = True
+    # The banner is assembled in a list and flushed to stderr in one write
+    # instead of ~25 print syscalls; routine token/env diagnostics only
+    # appear with MCP_DEBUG set, errors and the ready message always do
+    debug = bool(os.environ.get('MCP_DEBUG'))
+    lines = []
+
+    # Docker/systemd/CI deployments set the token straight in the
+    # environment — on that path the .env probe (three stats plus a file
+    # parse) never runs. Only token-less starts pay for discovery, which
+    # is shared with initialize() and runs at most once per process.
+    # Same precedence as initialize(): GITHUB_TOKENS (comma-separated
+    # rotation list) counts as a token too.
+    token = os.environ.get('GITHUB_TOKENS') or os.environ.get('GITHUB_TOKEN')
+    env_path = None if token else _load_env_once(verbose=debug)
+    env_loaded = env_path is not None
+    if not token:
+        token = os.environ.get('GITHUB_TOKENS') or os.environ.get('GITHUB_TOKEN')
+
+    if debug:
+        lines.append("\n🔑 Checking GITHUB_TOKEN environment variable...")
+        if token:
+            lines.append(f"   ✅ Token found: {token[:10]}... (length: {len(token)})")
         else:
-            print(f"   ❌ Not found: {env_path}", file=sys.stderr)
-            script_dir = Path(__file__).parent
-            env_path = script_dir / '.env'
-            if env_path.exists():
-                print(f"✅ Loading .env from: {env_path}", file=sys.stderr)
-                load_dotenv(env_path, override=True)
-                env_loaded = True
-            else:
-                print(f"   ❌ Not found: {env_path}", file=sys.stderr)
-                # Try parent directory of script (project root)
-                env_path = script_dir.parent / '.env'
-                if env_path.exists():
-                    print(f"✅ Loading .env from: {env_path}", file=sys.stderr)
-                    load_dotenv(env_path, override=True)
-                    env_loaded = True
-                else:
-                    print(f"   ❌ Not found: {env_path}", file=sys.stderr)
-    else:
-        print(f"⚠️  python-dotenv not available, relying on environment variables", file=sys.stderr)
-    
-    # Check if token is available
-    token = os.getenv('GITHUB_TOKEN')
-    
-    # Debug output
-    print(f"\n🔑 Checking GITHUB_TOKEN environment variable...", file=sys.stderr)
-    if token:
-        print(f"   ✅ Token found: {token[:10]}... (length: {len(token)})", file=sys.stderr)
-    else:
-        print(f"   ❌ Token not found in environment", file=sys.stderr)
-    
+            lines.append("   ❌ Token not found in environment")
+
     if env_loaded and not token:
-        print(f"⚠️  Warning: .env file was loaded but GITHUB_TOKEN is empty", file=sys.stderr)
-        print(f"    .env file location: {env_path}", file=sys.stderr)
-        print(f"    File exists: {env_path.exists()}", file=sys.stderr)
-        print(f"    File content preview:", file=sys.stderr)
-        try:
-            with open(env_path, 'r') as f:
-                content = f.read()
-                print(f"    Length: {len(content)} chars", file=sys.stderr)
-                print(f"    Lines: {content.splitlines()}", file=sys.stderr)
-        except Exception as e:
-            print(f"    Could not read file: {e}", file=sys.stderr)
-    
+        lines.append("⚠️  Warning: .env file was loaded but GITHUB_TOKEN is empty")
+        lines.append(f"    .env file location: {env_path}")
+        # The content preview re-reads the file python-dotenv just parsed
+        # (and echoes whatever it holds to stderr) — only pay that when
+        # debugging is asked for
+        if debug:
+            lines.append(f"    File exists: {os.path.exists(env_path)}")
+            lines.append("    File content preview:")
+            try:
+                with open(env_path, 'r') as f:
+                    content = f.read()
+                lines.append(f"    Length: {len(content)} chars")
+                lines.append(f"    Lines: {content.splitlines()}")
+            except Exception as e:
+                lines.append(f"    Could not read file: {e}")
+
     if not token:
-        print("=" * 80, file=sys.stderr)
-        print("❌ ERROR: GitHub token not found!", file=sys.stderr)
-        print("", file=sys.stderr)
-        print("To use this MCP server, you need to provide a GitHub token:", file=sys.stderr)
-        print("", file=sys.stderr)
-        print("Option 1: Create a .env file in the project directory:", file=sys.stderr)
-        print("  GITHUB_TOKEN=your_github_token_here", file=sys.stderr)
-        print("", file=sys.stderr)
-        print("Option 2: Set the GITHUB_TOKEN environment variable:", file=sys.stderr)
-        print("  export GITHUB_TOKEN=your_github_token_here", file=sys.stderr)
-        print("", file=sys.stderr)
-        print("To create a token:", file=sys.stderr)
-        print("  1. Go to GitHub Settings → Developer settings → Personal access tokens", file=sys.stderr)
-        print("  2. Generate a new token with 'repo' and 'project' scopes", file=sys.stderr)
-        print("", file=sys.stderr)
-        print("=" * 80, file=sys.stderr)
+        lines.append(_USAGE_BANNER)
+        sys.stderr.write('\n'.join(lines) + '\n')
         sys.exit(1)
-    
+
     server, server_info, tools = create_mcp_server()
-    
+
     # MCP uses JSON-RPC over stdio
     # Read from stdin, write to stdout
     # This is a simplified implementation - a full MCP server would use the official SDK
-    
-    print(f"✅ GitHub Project Tasks MCP Server v{server_info['version']}", file=sys.stderr)
-    print(f"Description: {server_info['description']}", file=sys.stderr)
-    print(f"Available tools: {len(tools)}", file=sys.stderr)
-    print("", file=sys.stderr)
-    print("Tools:", file=sys.stderr)
+
+    lines.append(f"✅ GitHub Project Tasks MCP Server v{server_info['version']}")
+    lines.append(f"Description: {server_info['description']}")
+    lines.append(f"Available tools: {len(tools)}")
+    lines.append("")
+    lines.append("Tools:")
     for tool in tools:
-        print(f"  - {tool['name']}: {tool['description']}", file=sys.stderr)
-    print("", file=sys.stderr)
-    print("Ready to accept MCP requests via stdio", file=sys.stderr)
-    print("=" * 80, file=sys.stderr)
+        lines.append(f"  - {tool['name']}: {tool['description']}")
+    lines.append("")
+    lines.append("Ready to accept MCP requests via stdio")
+    lines.append("=" * 80)
+    sys.stderr.write('\n'.join(lines) + '\n')
     
     # For testing purposes, we can also provide a simple CLI interface
     if len(sys.argv) > 1 and sys.argv[1] == "test":
-        print("\n🧪 Test Mode - Demonstrating tool usage\n", file=sys.stderr)
-        
-        # Example: Get all tasks
-        print("Example 1: Get all project tasks", file=sys.stderr)
-        print("Tool: get_project_tasks_full", file=sys.stderr)
-        print("Arguments: {'org': '4d', 'project_id': 745}", file=sys.stderr)
-        print("", file=sys.stderr)
-        
-        # Example: Get child tasks
-        print("Example 2: Get child tasks of issue #123", file=sys.stderr)
-        print("Tool: get_child_tasks", file=sys.stderr)
-        print("Arguments: {'org': '4d', 'project_id': 745, 'task_number': 123}", file=sys.stderr)
-        print("", file=sys.stderr)
-        
-        # Example: Get task info
-        print("Example 3: Get detailed task information", file=sys.stderr)
-        print("Tool: get_task_info", file=sys.stderr)
-        print("Arguments: {'org': '4d', 'project_id': 745, 'task_number': 123}", file=sys.stderr)
-        print("", file=sys.stderr)
+        sys.stderr.write(_TEST_MODE_EXAMPLES)
     else:
         # Simple stdin/stdout handler for MCP protocol
-        # In production, you would use the official MCP SDK
+        # In production, you would use the official MCP SDK.
+        # Messages are read and written as raw bytes: the byte buffer is
+        # split on newlines and handed straight to the JSON parser, and
+        # responses go out as one bytes write — no text-mode encode/decode
+        # of multi-MB payloads in either direction.
+        stdin = sys.stdin.buffer
+        stdout = sys.stdout.buffer
+        buffer = bytearray()
+        # One reusable read buffer: readinto fills it in place, so draining
+        # stdin never allocates a fresh bytes object per chunk
+        read_buf = bytearray(65536)
+        read_view = memoryview(read_buf)
+
+        # tools/list and initialize results never change at runtime;
+        # serialize each once and splice the request id into a prebuilt
+        # envelope instead of re-serializing the tools blob per request
+        tools_list_bytes = _dumps_bytes({"tools": tools})
+        init_bytes = _dumps_bytes({
+            "protocolVersion": "2024-11-05",
+            "capabilities": {"tools": {}},
+            "serverInfo": server_info
+        })
+
+        def response_bytes(request_id, result_bytes: bytes) -> bytes:
+            return (b'{"jsonrpc":"2.0","id":' + _dumps_bytes(request_id) +
+                    b',"result":' + result_bytes + b'}')
+
+        def error_bytes(request_id, code: int, message: str) -> bytes:
+            # Splice into the static skeleton instead of serializing a
+            # fresh three-level dict per bad request; only the id and
+            # message go through the JSON encoder
+            return (b'{"jsonrpc":"2.0","id":' + _dumps_bytes(request_id) +
+                    b',"error":{"code":%d,"message":' % code +
+                    _dumps_bytes(message) + b'}}')
+
+        # Malformed frames all get the same answer; build it once. Valid
+        # JSON that is not an object or batch array (a bare scalar) is a
+        # different failure — Invalid Request, not Parse error
+        parse_error_bytes = error_bytes(None, -32700, "Parse error") + b'\n'
+        invalid_request_bytes = error_bytes(
+            None, -32600, "Invalid Request: not an object") + b'\n'
+
+        def handle_tools_list(request, request_id):
+            return response_bytes(request_id, tools_list_bytes)
+
+        def handle_initialize(request, request_id):
+            return response_bytes(request_id, init_bytes)
+
+        def handle_tools_call(request, request_id):
+            params = request.get("params", {})
+            result = handle_tool_call(server, params.get("name"),
+                                      params.get("arguments", {}))
+            return response_bytes(request_id, _dumps_bytes(result))
+
+        # Method name -> handler; adding an RPC method is one entry here
+        # and dispatch stays a single hash lookup
+        method_handlers = {
+            "tools/list": handle_tools_list,
+            "initialize": handle_initialize,
+            "tools/call": handle_tools_call,
+        }
+
+        def dispatch(request) -> bytes:
+            """Handle one request object and return its serialized response.
+
+            Returns None for notifications (no id), which per JSON-RPC get
+            no response. Used directly for the cheap static methods and as
+            the per-element worker for batch arrays; standalone tools/call
+            requests go through the executor instead so they never block
+            the read loop.
+            """
+            if not isinstance(request, dict):
+                return error_bytes(None, -32600, "Invalid Request: not an object")
+            method = request.get("method")
+            request_id = request.get("id")
+            handler = method_handlers.get(method)
+            if handler is None:
+                data = error_bytes(request_id, -32601, f"Method not found: {method}")
+            else:
+                data = handler(request, request_id)
+            return data if 'id' in request else None
+
+        def run_batch(batch):
+            # Elements fan out across the tool pool — batched tool calls
+            # are network-bound, so N of them cost ~max(RTT) instead of
+            # N·RTT — and are gathered back in request order into a single
+            # array write. run_batch itself runs on the separate gather
+            # pool, so batches waiting on their elements can never occupy
+            # the workers those elements need.
+            futures = [executor.submit(dispatch, m) for m in batch]
+            parts = [part for part in (f.result() for f in futures) if part is not None]
+            if parts:
+                respond(b'[' + b','.join(parts) + b']\n')
+
+        # Tool calls are network-bound; running them on a small pool keeps
+        # stdin reading responsive and lets independent requests overlap
+        # (the manager coalesces concurrent fetches of the same project).
+        # A lock keeps each response a single uninterleaved stdout write;
+        # clients correlate out-of-order responses by id.
+        executor = ThreadPoolExecutor(max_workers=4)
+        # Batch gathers live on their own small pool (see run_batch)
+        gather_pool = ThreadPoolExecutor(max_workers=2)
+        write_lock = threading.Lock()
+
+        def respond(data: bytes):
+            with write_lock:
+                stdout.write(data)
+                stdout.flush()
+
+        def run_tool(request_id, tool_name, arguments):
+            result = handle_tool_call(server, tool_name, arguments)
+            # Splice the serialized result into the envelope instead of
+            # serializing a response dict that embeds it a second time
+            respond(response_bytes(request_id, _dumps_bytes(result)) + b'\n')
         try:
-            for line in sys.stdin:
-                if not line.strip():
-                    continue
-                
-                try:
-                    request = json.loads(line)
-                    
-                    if request.get("method") == "tools/list":
-                        response = {
-                            "jsonrpc": "2.0",
-                            "id": request.get("id"),
-                            "result": {
-                                "tools": tools
-                            }
-                        }
-                        print(json.dumps(response), flush=True)
-                    
+            while True:
+                n = stdin.readinto(read_buf)
+                if not n:
+                    break
+                buffer += read_view[:n]
+
+                while True:
+                    newline = buffer.find(b'\n')
+                    if newline < 0:
+                        break
+                    line = bytes(buffer[:newline])
+                    del buffer[:newline + 1]
+                    line = line.strip()
+                    if not line:
+                        continue
+                    # A JSON-RPC frame must be an object (or batch array).
+                    # Other frames never reach dispatch, but they still
+                    # parse once to pick the right error: a valid scalar
+                    # like 42 is an Invalid Request, garbage a Parse error
+                    if line[:1] not in (b'{', b'['):
+                        try:
+                            _loads(line)
+                        except ValueError as e:
+                            print(f"Invalid JSON: {e}", file=sys.stderr)
+                            respond(parse_error_bytes)
+                        else:
+                            print("Invalid request: frame is not an object or array",
+                                  file=sys.stderr)
+                            respond(invalid_request_bytes)
+                        continue
+
+                    # The try covers only the parse; everything after it is
+                    # plain conditionals on checked shapes, so the success
+                    # path sets up no per-request exception handling (tool
+                    # errors are contained inside handle_tool_call)
+                    try:
+                        request = _loads(line)
+                    except ValueError as e:
+                        print(f"Invalid JSON: {e}", file=sys.stderr)
+                        respond(parse_error_bytes)
+                        continue
+
+                    if isinstance(request, list):
+                        # JSON-RPC batch: dispatch every element and
+                        # answer with a single array
+                        if not request:
+                            respond(error_bytes(None, -32600,
+                                                "Invalid Request: empty batch") + b'\n')
+                        elif len(request) > _MAX_BATCH:
+                            respond(error_bytes(None, -32600,
+                                                f"Batch too large (limit {_MAX_BATCH})") + b'\n')
+                        else:
+                            ids = [r.get("id") for r in request
+                                   if isinstance(r, dict) and r.get("id") is not None]
+                            if len(ids) != len(set(ids)):
+                                respond(error_bytes(None, -32600,
+                                                    "Invalid Request: duplicate ids in batch") + b'\n')
+                            else:
+                                gather_pool.submit(run_batch, request)
+
                     elif request.get("method") == "tools/call":
+                        # A frame passing the first-byte check always parses
+                        # to a dict or a list, so no non-dict case remains
                         params = request.get("params", {})
-                        tool_name = params.get("name")
-                        arguments = params.get("arguments", {})
-                        
-                        result = handle_tool_call(server, tool_name, arguments)
-                        
-                        response = {
-                            "jsonrpc": "2.0",
-                            "id": request.get("id"),
-                            "result": result
-                        }
-                        print(json.dumps(response), flush=True)
-                    
-                    elif request.get("method") == "initialize":
-                        response = {
-                            "jsonrpc": "2.0",
-                            "id": request.get("id"),
-                            "result": {
-                                "protocolVersion": "2024-11-05",
-                                "capabilities": {
-                                    "tools": {}
-                                },
-                                "serverInfo": server_info
-                            }
-                        }
-                        print(json.dumps(response), flush=True)
-                    
+                        if 'id' in request:
+                            executor.submit(run_tool, request.get("id"),
+                                            params.get("name"),
+                                            params.get("arguments", {}))
+                        else:
+                            # Notification: run the tool for its side
+                            # effects but suppress the response, matching
+                            # dispatch()'s handling inside batches
+                            executor.submit(handle_tool_call, server,
+                                            params.get("name"),
+                                            params.get("arguments", {}))
+
                     else:
-                        response = {
-                            "jsonrpc": "2.0",
-                            "id": request.get("id"),
-                            "error": {
-                                "code": -32601,
-                                "message": f"Method not found: {request.get('method')}"
-                            }
-                        }
-                        print(json.dumps(response), flush=True)
-                
-                except json.JSONDecodeError as e:
-                    print(f"Invalid JSON: {e}", file=sys.stderr)
-                except Exception as e:
-                    print(f"Error processing request: {e}", file=sys.stderr)
-        
+                        data = dispatch(request)
+                        if data is not None:
+                            respond(data + b'\n')
+
+            # stdin closed: finish any in-flight tool calls before exiting
+            gather_pool.shutdown(wait=True)
+            executor.shutdown(wait=True)
+
         except KeyboardInterrupt:
             print("\nShutting down MCP server", file=sys.stderr)
+            gather_pool.shutdown(wait=False)
+            executor.shutdown(wait=False)
             sys.exit(0)
 
 
@@ -0,0 +1,113 @@
+"""Regression tests for tool-call extraction in create_project_tasks.
+
+find_tool_calls and iter_tool_calls_streaming must extract the same calls
+in the same order regardless of which parser is active — these tests pin
+the pruning semantics (a matched call's arguments are data; everything
+else is searched) on the documents where the two implementations have
+historically diverged.
+
+Run with: python -m unittest discover tests
+"""
+
+import io
+import json
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from create_project_tasks import (
+    IJSON_AVAILABLE,
+    find_tool_calls,
+    iter_tool_calls_streaming,
+)
+
+TOOL = 'create_test_case_task'
+
+
+def call(title, **extra):
+    return {"tool": TOOL, "arguments": {"title": title, **extra}}
+
+
+class FindToolCallsTest(unittest.TestCase):
+
+    def titles(self, doc):
+        return [args['title'] for args in find_tool_calls(doc)]
+
+    def test_call_under_non_matching_arguments_is_found(self):
+        # A non-matching object's arguments are data to the object but may
+        # still hold real calls — they must be descended, not pruned
+        doc = {"tool": "other", "arguments": {"x": call("A")}}
+        self.assertEqual(self.titles(doc), ["A"])
+
+    def test_matched_call_arguments_are_pruned(self):
+        doc = call("B", example={"tool": TOOL, "arguments": {"title": "NESTED"}})
+        self.assertEqual(self.titles(doc), ["B"])
+
+    def test_matched_call_other_values_are_searched(self):
+        # Only the arguments payload is pruned; a call under a sibling key
+        # of a matched call is still extracted
+        doc = {"tool": TOOL, "arguments": {"title": "M"}, "extra": call("N")}
+        self.assertEqual(self.titles(doc), ["N", "M"])
+
+    def test_scalar_and_null_arguments(self):
+        doc = {"calls": [{"tool": TOOL, "arguments": None},
+                         {"tool": TOOL, "arguments": 5}]}
+        self.assertEqual(find_tool_calls(doc), [None, 5])
+
+
+@unittest.skipUnless(IJSON_AVAILABLE, "ijson not installed")
+class StreamingEquivalenceTest(unittest.TestCase):
+    """The ijson walker must match find_tool_calls on every document."""
+
+    def assert_equivalent(self, doc):
+        eager = find_tool_calls(doc)
+        streamed = list(iter_tool_calls_streaming(
+            io.BytesIO(json.dumps(doc).encode())))
+        self.assertEqual(eager, streamed)
+        return eager
+
+    def test_call_under_non_matching_arguments(self):
+        # Historically dropped by the streaming path only
+        result = self.assert_equivalent(
+            {"tool": "other", "arguments": {"x": call("A")}})
+        self.assertEqual([a['title'] for a in result], ["A"])
+
+    def test_call_nested_in_matched_arguments_is_pruned(self):
+        result = self.assert_equivalent(
+            call("B", example={"tool": TOOL, "arguments": {"title": "NESTED"}}))
+        self.assertEqual([a['title'] for a in result], ["B"])
+
+    def test_mixed_document(self):
+        result = self.assert_equivalent({
+            "suites": [
+                call("A"),
+                {"tool": "other", "arguments": {"x": call("B"),
+                                                "list": [call("C")]}},
+                {"tool": "other", "arguments": {
+                    "again": {"tool": "other", "arguments": {"y": call("D")}}}},
+                {"wrapper": {"tool": "other", "arguments": {"x": call("E")}},
+                 "after": call("F")},
+            ]
+        })
+        self.assertEqual([a['title'] for a in result],
+                         ["A", "B", "C", "D", "E", "F"])
+
+    def test_arguments_key_before_tool_key(self):
+        # The walker cannot decide a match until the tool value arrives;
+        # parked calls must still come out (or be pruned) correctly
+        self.assert_equivalent({"arguments": {"x": call("I")}, "tool": "other"})
+        self.assert_equivalent({"arguments": {"title": "J", "x": call("PRUNED")},
+                                "tool": TOOL})
+        self.assert_equivalent({"arguments": {"x": call("K")}, "tool": "other",
+                                "k": call("L")})
+
+    def test_scalar_arguments_and_arrays(self):
+        self.assert_equivalent({"calls": [{"tool": TOOL, "arguments": None},
+                                          {"tool": TOOL, "arguments": 5}]})
+        self.assert_equivalent({"tool": "other", "arguments": {
+            "k": {"tool": TOOL, "arguments": [1, 2]}}})
+
+
+if __name__ == '__main__':
+    unittest.main()